@@ -0,0 +1,55 @@
+import os
+import tempfile
+import time
+
+import numba
+import numpy as np
+
+import sleplet
+
+ASSEMBLIES = ("loop", "product")
+L = 24
+NCPU = int(os.getenv("NCPU", "4"))
+PHI_MAX = 40
+PHI_MIN = 0
+THETA_MAX = 60
+THETA_MIN = 20
+# the loop assembly limits the numba threads to NCPU
+THREADS = min(NCPU, numba.config.NUMBA_NUM_THREADS)
+
+
+def _report_assembly(name: str, assembly: str) -> None:
+    """
+    Time the construction of the lat-lon Slepian class with an assembly and
+    report how well the cores were used. The class is built in an empty data
+    folder so that the eigensolutions aren't cached.
+    """
+    with tempfile.TemporaryDirectory() as data_path:
+        os.environ["XDG_DATA_HOME"] = data_path
+        wall, cpu = time.perf_counter(), time.process_time()
+        sleplet.slepian.SlepianLimitLatLon(
+            L,
+            theta_min=np.deg2rad(THETA_MIN),
+            theta_max=np.deg2rad(THETA_MAX),
+            phi_min=np.deg2rad(PHI_MIN),
+            phi_max=np.deg2rad(PHI_MAX),
+            assembly=assembly,
+        )
+        wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+    print(
+        f"{name}: {wall:.2f}s, core utilisation {100 * cpu / (wall * THREADS):.0f}%",
+    )
+
+
+def main() -> None:
+    """Compare the assemblies of the lat-lon Slepian matrix over the threads."""
+    print(f"NCPU={NCPU}, L={L}, threads={THREADS}")
+    # compile the kernels before timing
+    for assembly in ASSEMBLIES:
+        _report_assembly(f"warm-up {assembly}", assembly)
+    for assembly in ASSEMBLIES:
+        _report_assembly(assembly, assembly)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+import os
+import resource
+import tempfile
+import time
+
+import multiprocess
+
+import sleplet
+
+EIGENSOLVERS = ("shift_invert", "lobpcg", "slicing")
+MESH = "bird"
+NCPU = os.getenv("NCPU", "4")
+# not precomputed, so that the basis functions are always solved for
+NUMBER_BASIS_FUNCTIONS = 600
+
+
+def _measure_eigensolver(eigensolver: str) -> tuple[float, float]:
+    """
+    Time the construction of the mesh with an eigensolver and measure the peak
+    memory of the process. The mesh is built in an empty data folder so that
+    the basis functions aren't cached.
+    """
+    with tempfile.TemporaryDirectory() as data_path:
+        os.environ["XDG_DATA_HOME"] = data_path
+        start = time.perf_counter()
+        sleplet.meshes.Mesh(
+            MESH,
+            number_basis_functions=NUMBER_BASIS_FUNCTIONS,
+            eigensolver=eigensolver,
+        )
+        timing = time.perf_counter() - start
+    # the maximum resident set size is in kilobytes on Linux
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    return timing, peak
+
+
+def main() -> None:
+    """Compare the time and peak memory of each of the mesh eigensolvers."""
+    print(f"NCPU={NCPU}, mesh={MESH}")
+    for eigensolver in EIGENSOLVERS:
+        # each eigensolver is run in a fresh process so the peaks are separate
+        with multiprocess.get_context("spawn").Pool(processes=1) as p:
+            timing, peak = p.apply(_measure_eigensolver, (eigensolver,))
+        print(f"{eigensolver}: {timing:.2f}s, peak memory {peak:.0f}MB")
+
+
+if __name__ == "__main__":
+    main()
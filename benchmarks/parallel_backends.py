@@ -0,0 +1,82 @@
+import collections.abc
+import os
+import tempfile
+import time
+
+import numpy as np
+
+import sleplet
+
+BACKENDS = ("serial", "threads", "processes")
+L = 16
+MASK = "south_america"
+MESH = "bird"
+NCPU = os.getenv("NCPU", "4")
+# neither are precomputed, so that the Slepian matrices are always built
+EIGENSOLVER = "partial"
+NUMBER_BASIS_FUNCTIONS = 600
+THETA_MAX = 40
+
+
+def _time_constructor(
+    name: str,
+    constructor: collections.abc.Callable[[], object],
+) -> None:
+    """
+    Time the construction of a Slepian class with each backend and report the
+    speed-up. Each is built in an empty data folder so nothing is cached.
+    """
+    # build once first so that the compilation isn't timed
+    with tempfile.TemporaryDirectory() as data_path:
+        os.environ["XDG_DATA_HOME"] = data_path
+        constructor()
+    timings = {}
+    for backend in BACKENDS:
+        os.environ["PARALLEL_BACKEND"] = backend
+        with tempfile.TemporaryDirectory() as data_path:
+            os.environ["XDG_DATA_HOME"] = data_path
+            start = time.perf_counter()
+            constructor()
+            timings[backend] = time.perf_counter() - start
+    for backend, timing in timings.items():
+        print(
+            f"{name} {backend}: {timing:.2f}s, "
+            f"speed-up x{timings['serial'] / timing:.2f}",
+        )
+
+
+def main() -> None:
+    """Measure the speed-up of each parallel backend for the Slepian classes."""
+    print(f"NCPU={NCPU}, L={L}")
+    with tempfile.TemporaryDirectory() as data_path:
+        os.environ["XDG_DATA_HOME"] = data_path
+        mesh = sleplet.meshes.Mesh(
+            MESH,
+            number_basis_functions=NUMBER_BASIS_FUNCTIONS,
+        )
+
+    _time_constructor(
+        "polar cap",
+        lambda: sleplet.slepian.SlepianPolarCap(
+            L,
+            np.deg2rad(THETA_MAX),
+            eigensolver=EIGENSOLVER,
+        ),
+    )
+    _time_constructor(
+        "arbitrary",
+        lambda: sleplet.slepian.SlepianArbitrary(
+            L,
+            MASK,
+            assembly="integral",
+            eigensolver=EIGENSOLVER,
+        ),
+    )
+    _time_constructor(
+        "mesh",
+        lambda: sleplet.meshes.MeshSlepian(mesh, assembly="integral"),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+import logging
+import pathlib
+import shutil
+
+import numpy as np
+import numpy.typing as npt
+import platformdirs
+
+_logger = logging.getLogger(__name__)
+
+
+def find_checkpoint_directory(matrix_location: str) -> pathlib.Path:
+    """Find the folder holding the checkpoints of a matrix being built."""
+    return platformdirs.user_data_path() / f"{matrix_location}_checkpoint"
+
+
+def save_checkpoint(
+    directory: pathlib.Path,
+    name: str,
+    **arrays: npt.NDArray[np.complex128 | np.float64 | np.int_ | np.bool_],
+) -> None:
+    """
+    Save a completed chunk, it is written to a temporary file first so that
+    an interrupted write is never mistaken for a complete chunk.
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    temporary = directory / f"{name}.tmp.npz"
+    np.savez(temporary, **arrays)
+    temporary.replace(directory / f"{name}.npz")
+
+
+def load_checkpoint(
+    directory: pathlib.Path,
+    name: str,
+) -> dict[str, npt.NDArray[np.complex128 | np.float64 | np.int_ | np.bool_]] | None:
+    """Load a completed chunk if it exists."""
+    path = directory / f"{name}.npz"
+    return _read_checkpoint(path) if path.exists() else None
+
+
+def load_all_checkpoints(
+    directory: pathlib.Path,
+    prefix: str,
+) -> list[dict[str, npt.NDArray[np.complex128 | np.float64 | np.int_ | np.bool_]]]:
+    """Load every completed chunk whose name starts with the prefix."""
+    return [
+        _read_checkpoint(path)
+        for path in sorted(directory.glob(f"{prefix}*.npz"))
+        if not path.name.endswith(".tmp.npz")
+    ]
+
+
+def _read_checkpoint(
+    path: pathlib.Path,
+) -> dict[str, npt.NDArray[np.complex128 | np.float64 | np.int_ | np.bool_]]:
+    """Read the arrays of a completed chunk."""
+    msg = f"resuming from checkpoint {path}"
+    _logger.info(msg)
+    with np.load(path) as checkpoint:
+        return dict(checkpoint)
+
+
+def remove_checkpoint_directory(directory: pathlib.Path) -> None:
+    """Remove the checkpoints once the final result has been saved."""
+    shutil.rmtree(directory, ignore_errors=True)
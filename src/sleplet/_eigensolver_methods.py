@@ -0,0 +1,41 @@
+import numpy as np
+import numpy.linalg as LA  # noqa: N812
+import numpy.typing as npt
+import scipy.linalg
+import scipy.sparse.linalg as LA_sparse  # noqa: N812
+
+
+def solve_hermitian_eigenproblem(
+    matrix: npt.NDArray[np.complex128 | np.float64] | LA_sparse.LinearOperator,
+    eigensolver: str,
+    n_eigenpairs: int,
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.complex128 | np.float64]]:
+    """
+    Solve the Hermitian eigenproblem with either the full dense solver, or
+    a partial or iterative solver which only finds the largest `n_eigenpairs`.
+    Only the iterative solver accepts a `LinearOperator`.
+    """
+    match eigensolver:
+        case "dense":
+            return LA.eigh(matrix)
+        case "partial":
+            size = len(matrix)
+            n_eigenpairs = min(n_eigenpairs, size)
+            return scipy.linalg.eigh(
+                matrix,
+                subset_by_index=[size - n_eigenpairs, size - 1],
+                driver="evr",
+            )
+        case "iterative":
+            size = matrix.shape[0]
+            if isinstance(matrix, np.ndarray) and n_eigenpairs >= size - 1:
+                # ARPACK can't find all the eigenpairs of a small matrix
+                return LA.eigh(matrix)
+            return LA_sparse.eigsh(
+                matrix,
+                k=min(n_eigenpairs, size - 2),
+                which="LA",
+            )
+        case _:
+            msg = f"'{eigensolver}' is not a valid eigensolver"
+            raise ValueError(msg)
@@ -2,7 +2,9 @@ import functools
 import typing
 
 import numpy as np
+import numpy.linalg as LA  # noqa: N812
 import numpy.typing as npt
+import scipy.special
 
 import pyssht as ssht
 
@@ -21,6 +23,118 @@ def calc_integration_weight(L: int) -> npt.NDArray[np.float64]:
     return np.sin(thetas) * delta_theta * delta_phi
 
 
+def calc_exact_integration_weight(resolution: int) -> npt.NDArray[np.float64]:
+    """
+    Compute the quadrature weights of the MWSS sampling which exactly integrate
+    a signal over the sphere up to a bandlimit of resolution + 1. After the sum
+    over phi only the m=0 component remains, which is a cosine series in theta.
+    """
+    thetas = ssht.sample_positions(
+        resolution,
+        Method=sleplet._vars.SAMPLING_SCHEME,
+    )[0]
+    n = np.arange(resolution + 1)
+    # integral of cos(n theta) sin(theta) over [0, pi]
+    moments = np.zeros(resolution + 1)
+    even = n % 2 == 0
+    moments[even] = 2 / (1 - n[even] ** 2)
+    weight_theta = LA.solve(np.cos(np.outer(n, thetas)), moments)
+    weight_phi = np.pi / resolution
+    return np.tile(weight_theta[:, np.newaxis] * weight_phi, (1, 2 * resolution))
+
+
+def calc_lat_lon_integration_weight(
+    L: int,
+    resolution: int,
+    theta_ranges: list[tuple[float, float]],
+    phi_range: tuple[float, float],
+) -> npt.NDArray[np.float64]:
+    """
+    Compute the weights which exactly integrate the product of two signals of
+    bandlimit L over a region bounded by lines of latitude and longitude. The
+    product has Fourier modes up to 2L-2 in both angles, so the samples of the
+    resolution must at least match the number of modes, i.e. resolution >= 4L-4.
+    """
+    if resolution < 4 * L - 4:
+        msg = f"resolution should be at least {4 * L - 4} for L={L}"
+        raise ValueError(msg)
+    thetas, phis = ssht.sample_positions(
+        resolution,
+        Method=sleplet._vars.SAMPLING_SCHEME,
+    )
+    weight_theta = sum(
+        _calc_interval_weight(thetas, theta_range, 2 * (L - 1), jacobian=True)
+        for theta_range in theta_ranges
+    )
+    weight_phi = _calc_interval_weight(phis, phi_range, 2 * (L - 1), jacobian=False)
+    return np.outer(weight_theta, weight_phi)
+
+
+@functools.lru_cache(maxsize=8)
+def calc_polar_cap_quadrature(
+    L: int,
+    theta_max: float,
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """
+    Compute the L Gauss-Legendre nodes in cos(theta) over a polar cap, with
+    the weights including the integral over phi, which exactly integrate the
+    product of two axisymmetric signals of bandlimit L over the cap. These are
+    cached as they are shared between the orders.
+    """
+    nodes, weights = scipy.special.roots_legendre(L)
+    cos_theta_max = np.cos(theta_max)
+    nodes = (1 - cos_theta_max) / 2 * nodes + (1 + cos_theta_max) / 2
+    weights *= np.pi * (1 - cos_theta_max)
+    nodes.setflags(write=False)
+    weights.setflags(write=False)
+    return nodes, weights
+
+
+def _calc_interval_weight(
+    samples: npt.NDArray[np.float64],
+    interval: tuple[float, float],
+    degree: int,
+    *,
+    jacobian: bool,
+) -> npt.NDArray[np.float64]:
+    """
+    Find the minimum norm weights on the samples which integrate all the
+    Fourier modes up to the degree exactly over the interval, optionally
+    including the sin(theta) Jacobian.
+    """
+    n = np.arange(degree + 1)
+    if jacobian:
+        # sin(theta) exp(i n theta) = (exp(i (n+1) theta) - exp(i (n-1) theta)) / 2i
+        moments = (
+            _integrate_exponential(n + 1, interval)
+            - _integrate_exponential(n - 1, interval)
+        ) / 2j
+    else:
+        moments = _integrate_exponential(n, interval)
+    modes = np.concatenate(
+        (np.cos(np.outer(n, samples)), np.sin(np.outer(n[1:], samples))),
+    )
+    return LA.lstsq(
+        modes,
+        np.concatenate((moments.real, moments[1:].imag)),
+        rcond=None,
+    )[0]
+
+
+def _integrate_exponential(
+    k: npt.NDArray[np.int_],
+    interval: tuple[float, float],
+) -> npt.NDArray[np.complex128]:
+    """Compute the integral of exp(i k x) over the interval."""
+    lower, upper = interval
+    integral = np.full(k.shape, upper - lower, dtype=np.complex128)
+    nonzero = k != 0
+    integral[nonzero] = (
+        np.exp(1j * k[nonzero] * upper) - np.exp(1j * k[nonzero] * lower)
+    ) / (1j * k[nonzero])
+    return integral
+
+
 def integrate_whole_sphere(
     weight: npt.NDArray[np.float64],
     *functions: npt.NDArray[np.complex128],
@@ -30,14 +144,30 @@ def integrate_whole_sphere(
     return (multiplied_inputs * weight).sum()
 
 
-def integrate_region_sphere(
-    mask: npt.NDArray[np.float64],
-    weight: npt.NDArray[np.float64],
+def compress_region(
+    mask: npt.NDArray[np.bool_ | np.float64],
+    weight: npt.NDArray[np.float64] | None = None,
+) -> tuple[npt.NDArray[np.int_], npt.NDArray[np.float64]]:
+    """
+    Compress a mask to the flat indices of the pixels within the region and
+    their weights pre-multiplied by the mask, so that integrating over the
+    region only visits the pixels within it.
+    """
+    indices = np.flatnonzero(mask)
+    weights = mask.reshape(-1)[indices].astype(np.float64)
+    if weight is not None:
+        weights *= weight.reshape(-1)[indices]
+    return indices, weights
+
+
+def integrate_compressed_region(
+    indices: npt.NDArray[np.int_],
+    weights: npt.NDArray[np.float64],
     *functions: npt.NDArray[np.complex128 | np.float64],
 ) -> complex:
-    """Compute the integration for a region of the sphere."""
-    multiplied_inputs = _multiply_args(*functions)
-    return (multiplied_inputs * weight * mask).sum()
+    """Compute the integration for a region given by its compressed pixels."""
+    multiplied_inputs = _multiply_args(*(f.reshape(-1)[indices] for f in functions))
+    return (multiplied_inputs * weights).sum()
 
 
 def integrate_whole_mesh(
@@ -50,17 +180,6 @@ def integrate_whole_mesh(
     return multiplied_inputs.sum()
 
 
-def integrate_region_mesh(
-    mask: npt.NDArray[np.bool_],
-    vertices: npt.NDArray[np.float64],  # noqa: ARG001
-    faces: npt.NDArray[np.int_],  # noqa: ARG001
-    *functions: npt.NDArray[np.complex128 | np.float64],
-) -> float:
-    """Compute the integral of a region of functions on the vertices."""
-    multiplied_inputs = _multiply_args(*functions)
-    return (multiplied_inputs * mask).sum()
-
-
 def _multiply_args(*args: npt.NDArray[typing.Any]) -> npt.NDArray[typing.Any]:
     """Multiply an unknown number of arguments."""
     return functools.reduce((lambda x, y: x * y), args)
@@ -132,7 +132,7 @@ def create_mesh_region(
 def ensure_masked_bandlimit_mesh_signal(
     mesh: "sleplet.meshes.mesh.Mesh",
     u_i: npt.NDArray[np.complex128 | np.float64],
-) -> npt.NDArray[np.float64]:
+) -> npt.NDArray[np.complex128 | np.float64]:
     """Ensure that signal in pixel space is bandlimited."""
     field = sleplet.harmonic_methods.mesh_inverse(mesh, u_i)
     masked_field = np.where(mesh.mesh_region, field, 0)
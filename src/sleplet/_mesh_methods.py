@@ -1,18 +1,28 @@
 import logging
 import pathlib
+import threading
+import time
 import typing
 
 import igl
 import numpy as np
 import numpy.typing as npt
 import platformdirs
+import scipy.sparse
 import scipy.sparse.linalg as LA_sparse  # noqa: N812
 import tomli
 
 import sleplet._data.setup_pooch
 import sleplet._integration_methods
+import sleplet._parallel_methods
 
+_FACTORISATION_CACHE_SIZE = 8
+_GUARD_EIGENPAIRS = 10
+_LOBPCG_SHIFT = 1e-2
+_SLICE_MARGIN = 1.5
 _data_path = pathlib.Path(__file__).resolve().parent / "_data"
+_factorisations: dict[tuple[str, float], LA_sparse.LinearOperator] = {}
+_factorisations_lock = threading.Lock()
 _logger = logging.getLogger(__name__)
 
 
@@ -68,6 +78,7 @@ def mesh_eigendecomposition(
     faces: npt.NDArray[np.int_],
     *,
     number_basis_functions: int | None = None,
+    eigensolver: str = "shift_invert",
 ) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64], int]:
     """
     Compute the eigendecomposition of the mesh represented
@@ -95,12 +106,12 @@ def mesh_eigendecomposition(
             sleplet._data.setup_pooch.find_on_pooch_then_local(evec_loc),
         )
     except TypeError:
-        laplacian = _mesh_laplacian(vertices, faces)
-        eigenvalues, eigenvectors = LA_sparse.eigsh(
-            laplacian,
-            k=number_basis_functions,
-            which="LM",
-            sigma=0,
+        eigenvalues, eigenvectors = solve_laplacian_eigenproblem(
+            name,
+            vertices,
+            faces,
+            number_basis_functions,
+            eigensolver,
         )
         eigenvectors = _orthonormalise_basis_functions(vertices, faces, eigenvectors.T)
         _logger.info("saving binaries...")
@@ -109,6 +120,51 @@ def mesh_eigendecomposition(
     return eigenvalues, eigenvectors, number_basis_functions
 
 
+def solve_laplacian_eigenproblem(
+    name: str,
+    vertices: npt.NDArray[np.float64],
+    faces: npt.NDArray[np.int_],
+    number_basis_functions: int,
+    eigensolver: str,
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """
+    Find the smallest eigenpairs of the mesh Laplacian with the chosen
+    strategy, the eigenvectors are returned as columns in ascending order.
+    """
+    laplacian = _mesh_laplacian(vertices, faces)
+    start = time.perf_counter()
+    match eigensolver:
+        case "shift_invert":
+            eigenvalues, eigenvectors = LA_sparse.eigsh(
+                laplacian,
+                k=number_basis_functions,
+                which="LM",
+                sigma=0,
+                OPinv=_factorise_shifted_laplacian(name, laplacian, 0),
+            )
+        case "lobpcg":
+            eigenvalues, eigenvectors = _solve_with_lobpcg(
+                laplacian,
+                number_basis_functions,
+            )
+        case "slicing":
+            eigenvalues, eigenvectors = _solve_with_spectrum_slicing(
+                name,
+                laplacian,
+                number_basis_functions,
+            )
+        case _:
+            msg = f"'{eigensolver}' is not a valid mesh eigensolver"
+            raise ValueError(msg)
+    msg = (
+        f"found {number_basis_functions} eigenpairs of {name} mesh "
+        f"with {eigensolver} in {time.perf_counter() - start:.2f}s"
+    )
+    _logger.info(msg)
+    order = np.argsort(eigenvalues)
+    return eigenvalues[order], eigenvectors[:, order]
+
+
 def read_mesh(
     mesh_config: dict[str, float | int | str],
 ) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.int_]]:
@@ -122,11 +178,203 @@ def read_mesh(
 def _mesh_laplacian(
     vertices: npt.NDArray[np.float64],
     faces: npt.NDArray[np.int_],
-) -> npt.NDArray[np.float64]:
+) -> scipy.sparse.csc_matrix:
     """Compute the cotagent mesh laplacian."""
     return -igl.cotmatrix(vertices, faces)
 
 
+def _factorise_shifted_laplacian(
+    name: str,
+    laplacian: scipy.sparse.csc_matrix,
+    sigma: float,
+) -> LA_sparse.LinearOperator:
+    """
+    Factorise the Laplacian shifted by sigma, which is the inverse operator
+    of a shift-invert solve about sigma. The factorisations are cached per
+    mesh and shift, so solving a mesh again (i.e. for a different number of
+    basis functions) reuses them.
+    """
+    key = (name, sigma)
+    with _factorisations_lock:
+        if key in _factorisations:
+            return _factorisations[key]
+    lu = LA_sparse.splu(
+        (laplacian - sigma * scipy.sparse.identity(laplacian.shape[0])).tocsc(),
+    )
+    shifted_inverse = LA_sparse.LinearOperator(
+        laplacian.shape,
+        matvec=lu.solve,
+        matmat=lu.solve,
+        dtype=np.float64,
+    )
+    with _factorisations_lock:
+        # discard the oldest factorisation once the cache is full
+        if len(_factorisations) >= _FACTORISATION_CACHE_SIZE:
+            del _factorisations[next(iter(_factorisations))]
+        _factorisations[key] = shifted_inverse
+    return shifted_inverse
+
+
+def _solve_with_lobpcg(
+    laplacian: scipy.sparse.csc_matrix,
+    number_basis_functions: int,
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """
+    Find the smallest eigenpairs with LOBPCG preconditioned by an incomplete
+    LU factorisation of the Laplacian, which is shifted to be definite. A few
+    guard vectors are iterated alongside the block to speed up convergence.
+    """
+    size = laplacian.shape[0]
+    shift = _LOBPCG_SHIFT * laplacian.diagonal().mean()
+    ilu = LA_sparse.spilu(
+        (laplacian + shift * scipy.sparse.identity(size)).tocsc(),
+        drop_tol=1e-4,
+        fill_factor=20,
+    )
+    preconditioner = LA_sparse.LinearOperator(
+        laplacian.shape,
+        matvec=ilu.solve,
+        matmat=ilu.solve,
+        dtype=np.float64,
+    )
+    block_size = min(number_basis_functions + _GUARD_EIGENPAIRS, size)
+    X = np.random.default_rng(0).standard_normal((size, block_size))
+    eigenvalues, eigenvectors = LA_sparse.lobpcg(
+        laplacian,
+        X,
+        M=preconditioner,
+        largest=False,
+        tol=1e-8,
+        maxiter=500,
+    )
+    order = np.argsort(eigenvalues)[:number_basis_functions]
+    return eigenvalues[order], eigenvectors[:, order]
+
+
+def _solve_with_spectrum_slicing(
+    name: str,
+    laplacian: scipy.sparse.csc_matrix,
+    number_basis_functions: int,
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """
+    Find the smallest eigenpairs by splitting the spectrum into windows which
+    are solved in parallel by shift-invert about their centres. The windows
+    are sized from Weyl's law, for which the cotangent Laplacian of a mesh
+    with V vertices has roughly V lambda / 4pi eigenvalues below lambda. Any
+    window which isn't covered by the eigenpairs found about its centre is
+    solved again with more eigenpairs, reusing the factorisation of its shift,
+    and windows are added until enough eigenpairs have been found.
+    """
+    size = laplacian.shape[0]
+    ncpu = sleplet._parallel_methods.get_ncpu()
+    width = 4 * np.pi * number_basis_functions / (size * ncpu)
+    n_eigenpairs = min(
+        int(_SLICE_MARGIN * size * width / (4 * np.pi)) + _GUARD_EIGENPAIRS,
+        size - 2,
+    )
+    # the Laplacian is positive semi-definite, so the first window starts
+    # just below zero to include the constant eigenvector
+    lower = -0.01 * width + width * np.arange(ncpu)
+
+    eigenvalues = np.full((ncpu, n_eigenpairs), np.nan)
+    eigenvectors = np.zeros((ncpu, size, n_eigenpairs))
+    eval_ext, shm_eval_ext = sleplet._parallel_methods.create_shared_memory_array(
+        eigenvalues,
+    )
+    evec_ext, shm_evec_ext = sleplet._parallel_methods.create_shared_memory_array(
+        eigenvectors,
+    )
+
+    def func(chunk: list[int]) -> None:
+        """Find the eigenpairs about the centre of each window."""
+        (
+            eval_int,
+            shm_eval_int,
+        ) = sleplet._parallel_methods.attach_to_shared_memory_block(
+            eigenvalues,
+            shm_eval_ext,
+        )
+        (
+            evec_int,
+            shm_evec_int,
+        ) = sleplet._parallel_methods.attach_to_shared_memory_block(
+            eigenvectors,
+            shm_evec_ext,
+        )
+
+        for i in chunk:
+            centre = lower[0] + (i + 0.5) * width
+            eval_int[i], evec_int[i] = _solve_window(
+                laplacian,
+                centre,
+                n_eigenpairs,
+                _factorise_shifted_laplacian(name, laplacian, centre),
+            )
+
+        sleplet._parallel_methods.free_shared_memory(shm_eval_int, shm_evec_int)
+
+    chunks = [np.array([i]) for i in range(ncpu)]
+    sleplet._parallel_methods.run_chunks_in_parallel(func, chunks, ncpu)
+    windows = list(zip(eval_ext.copy(), evec_ext.copy(), strict=True))
+    sleplet._parallel_methods.free_shared_memory(shm_eval_ext, shm_evec_ext)
+    sleplet._parallel_methods.release_shared_memory(shm_eval_ext, shm_evec_ext)
+
+    found_evals: list[npt.NDArray[np.float64]] = []
+    found_evecs: list[npt.NDArray[np.float64]] = []
+    i = 0
+    while sum(len(evals) for evals in found_evals) < number_basis_functions:
+        centre = lower[0] + (i + 0.5) * width
+        if i < len(windows):
+            window_evals, window_evecs = windows[i]
+        else:
+            window_evals, window_evecs = _solve_window(
+                laplacian,
+                centre,
+                n_eigenpairs,
+                _factorise_shifted_laplacian(name, laplacian, centre),
+            )
+        n_window = n_eigenpairs
+        while np.abs(window_evals - centre).max() <= width / 2 and n_window < size - 2:
+            msg = f"window {i} not covered, solving again"
+            _logger.info(msg)
+            n_window = min(2 * n_window, size - 2)
+            window_evals, window_evecs = _solve_window(
+                laplacian,
+                centre,
+                n_window,
+                _factorise_shifted_laplacian(name, laplacian, centre),
+            )
+        inside = (window_evals >= centre - width / 2) & (
+            window_evals < centre + width / 2
+        )
+        found_evals.append(window_evals[inside])
+        found_evecs.append(window_evecs[:, inside])
+        i += 1
+    eigenvalues = np.concatenate(found_evals)
+    eigenvectors = np.hstack(found_evecs)
+    order = np.argsort(eigenvalues)[:number_basis_functions]
+    return eigenvalues[order], eigenvectors[:, order]
+
+
+def _solve_window(
+    laplacian: scipy.sparse.csc_matrix,
+    centre: float,
+    n_eigenpairs: int,
+    shifted_inverse: LA_sparse.LinearOperator,
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """
+    Find the eigenpairs closest to the centre of a window, given the
+    factorisation of the Laplacian shifted by the centre.
+    """
+    return LA_sparse.eigsh(
+        laplacian,
+        k=n_eigenpairs,
+        which="LM",
+        sigma=centre,
+        OPinv=shifted_inverse,
+    )
+
+
 def _orthonormalise_basis_functions(
     vertices: npt.NDArray[np.float64],
     faces: npt.NDArray[np.int_],
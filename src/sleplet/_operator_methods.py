@@ -0,0 +1,93 @@
+import numpy as np
+import numpy.typing as npt
+import scipy.sparse.linalg as LA_sparse  # noqa: N812
+
+import pyssht as ssht
+
+import sleplet._integration_methods
+import sleplet._mask_methods
+import sleplet._vars
+import sleplet.harmonic_methods
+import sleplet.slepian.region
+
+_ARBITRARY_SAMPLES = 2
+_LAT_LON_SAMPLES = 4
+
+
+def choose_operator_resolution(L: int, region: "sleplet.slepian.region.Region") -> int:
+    """
+    Select the default resolution of the samples, arbitrary regions match the
+    resolution of their masks whereas the regions bounded by lines of latitude
+    and longitude need enough samples to be integrated exactly.
+    """
+    samples = (
+        _ARBITRARY_SAMPLES if region._region_type == "arbitrary" else _LAT_LON_SAMPLES
+    )
+    return samples * L
+
+
+def create_region_weight(
+    L: int,
+    resolution: int,
+    region: "sleplet.slepian.region.Region",
+) -> npt.NDArray[np.float64]:
+    """Create the integration weights over the region at the given resolution."""
+    match region._region_type:
+        case "arbitrary":
+            return sleplet._mask_methods.create_mask_region(
+                resolution,
+                region,
+            ) * sleplet._integration_methods.calc_integration_weight(resolution)
+        case "lim_lat_lon":
+            return sleplet._integration_methods.calc_lat_lon_integration_weight(
+                L,
+                resolution,
+                [(region.theta_min, region.theta_max)],
+                (region.phi_min, region.phi_max),
+            )
+        case "polar":
+            theta_ranges = [(0.0, region.theta_max)]
+            if region.gap:
+                theta_ranges.append((np.pi - region.theta_max, np.pi))
+            return sleplet._integration_methods.calc_lat_lon_integration_weight(
+                L,
+                resolution,
+                theta_ranges,
+                (0, 2 * np.pi),
+            )
+        case _:
+            msg = f"{region._region_type} is an invalid region type"
+            raise ValueError(msg)
+
+
+def create_concentration_operator(
+    L: int,
+    resolution: int,
+    weighted_mask: npt.NDArray[np.float64],
+) -> LA_sparse.LinearOperator:
+    """
+    Create the concentration operator as an inverse transform at the given
+    resolution, a multiplication by the weighted mask of the region and the
+    adjoint of the inverse transform, so the matrix is never formed.
+    """
+
+    def matvec(flm: npt.NDArray[np.complex128]) -> npt.NDArray[np.complex128]:
+        """Apply the concentration operator to the harmonic coefficients."""
+        f = sleplet.harmonic_methods.invert_flm_boosted(
+            flm.reshape(-1).astype(np.complex128),
+            L,
+            resolution,
+        )
+        flm_boosted = ssht.inverse_adjoint(
+            f * weighted_mask,
+            resolution,
+            Method=sleplet._vars.SAMPLING_SCHEME,
+        )
+        return flm_boosted[: L**2].reshape(flm.shape)
+
+    return LA_sparse.LinearOperator(
+        (L**2, L**2),
+        matvec=matvec,
+        rmatvec=matvec,
+        dtype=np.complex128,
+    )
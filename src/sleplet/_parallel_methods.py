@@ -1,7 +1,17 @@
+import collections.abc
+import concurrent.futures
+import logging
+import os
+
+import multiprocess
 import multiprocess.shared_memory
 import numpy as np
 import numpy.typing as npt
 
+_logger = logging.getLogger(__name__)
+
+_BACKENDS = ("processes", "serial", "threads")
+
 
 def split_arr_into_chunks(arr_max: int, ncpu: int) -> list[npt.NDArray[np.int_]]:
     """Split L into a list of arrays for parallelism."""
@@ -11,6 +21,24 @@ def split_arr_into_chunks(arr_max: int, ncpu: int) -> list[npt.NDArray[np.int_]]
     return [np.sort(arr[i::ncpu]) for i in range(ncpu)]
 
 
+def split_costs_into_chunks(
+    costs: npt.NDArray[np.float64],
+    ncpu: int,
+) -> list[npt.NDArray[np.int_]]:
+    """
+    Split the indices of work units with the given costs into chunks of
+    similar total cost, by assigning the most costly remaining unit to the
+    cheapest chunk so far.
+    """
+    totals = np.zeros(ncpu)
+    assignment = np.empty(len(costs), dtype=np.int_)
+    for i in np.argsort(costs, kind="stable")[::-1]:
+        chunk = totals.argmin()
+        assignment[i] = chunk
+        totals[chunk] += costs[i]
+    return [np.flatnonzero(assignment == chunk) for chunk in range(ncpu)]
+
+
 def create_shared_memory_array(
     array: npt.NDArray[np.float64],
 ) -> tuple[npt.NDArray[np.float64], multiprocess.shared_memory.SharedMemory]:
@@ -55,3 +83,57 @@ def release_shared_memory(
     """Releases the shared memory object."""
     for shm in shared_memory:
         shm.unlink()
+
+
+def get_ncpu() -> int:
+    """Retrieve the number of cores to use from the environment."""
+    ncpu = int(os.getenv("NCPU", "4"))
+    msg = f"Number of CPU={ncpu}"
+    _logger.info(msg)
+    return ncpu
+
+
+def get_backend() -> str:
+    """Retrieve the parallel execution backend from the environment."""
+    backend = os.getenv("PARALLEL_BACKEND", "threads")
+    if backend not in _BACKENDS:
+        msg = f"PARALLEL_BACKEND must be one of {_BACKENDS}, not {backend}"
+        raise ValueError(msg)
+    msg = f"Parallel backend={backend}"
+    _logger.info(msg)
+    return backend
+
+
+def run_chunks_in_parallel(
+    func: collections.abc.Callable[[list[int]], None],
+    chunks: list[npt.NDArray[np.int_]],
+    ncpu: int,
+    *,
+    backend: str | None = None,
+) -> None:
+    """
+    Apply a function to every chunk using the given execution backend.
+
+    The function should write its results into shared memory blocks, as any
+    return values are discarded. The `processes` backend pickles the function
+    with `dill`, so it may be a closure. Any exception raised in a worker is
+    re-raised here.
+
+    The `threads` backend only runs concurrently while the function releases
+    the GIL, i.e. within NumPy/SciPy routines or `nogil` numba kernels, and
+    otherwise runs no faster than `serial`.
+    """
+    index_chunks = [chunk.tolist() for chunk in chunks]
+    match backend or get_backend():
+        case "serial":
+            for chunk in index_chunks:
+                func(chunk)
+        case "threads":
+            with concurrent.futures.ThreadPoolExecutor(max_workers=ncpu) as e:
+                list(e.map(func, index_chunks))
+        case "processes":
+            with multiprocess.get_context("spawn").Pool(processes=ncpu) as p:
+                p.map(func, index_chunks)
+        case _:
+            msg = f"backend must be one of {_BACKENDS}"
+            raise ValueError(msg)
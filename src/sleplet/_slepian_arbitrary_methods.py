@@ -10,7 +10,10 @@ _MACHINE_EPSILON = 1e-14
 
 
 def clean_evals_and_evecs(
-    eigendecomposition: tuple[npt.NDArray[np.complex128], npt.NDArray[np.complex128]],
+    eigendecomposition: tuple[
+        npt.NDArray[np.complex128 | np.float64],
+        npt.NDArray[np.complex128],
+    ],
 ) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.complex128]]:
     """Need eigenvalues and eigenvectors to be in a certain format."""
     # access values
@@ -34,6 +37,47 @@ def clean_evals_and_evecs(
     return eigenvalues, eigenvectors
 
 
+def compute_conjugate_indices(
+    L: int,
+) -> tuple[npt.NDArray[np.int_], npt.NDArray[np.int_]]:
+    """Find the order of each harmonic and the index of the harmonic with -m."""
+    ind = np.arange(L**2)
+    ell = np.floor(np.sqrt(ind)).astype(int)
+    emm = ind - ell * (ell + 1)
+    return emm, ind - 2 * emm
+
+
+def fill_matrix_using_conjugate_symmetry(
+    matrix: npt.NDArray[np.complex128],
+) -> None:
+    """
+    For a real region D_{l-m,l'-m'} = (-1)^{m+m'} D_{lm,l'm'}^* so the lower
+    triangle can be filled from the rows with m >= 0, using the Hermitian symmetry
+    for those conjugate elements which lie in the upper triangle.
+    """
+    emm, conjugate = compute_conjugate_indices(round(np.sqrt(len(matrix))))
+    ell = np.floor(np.sqrt(np.arange(len(matrix)))).astype(int)
+    rows, cols = np.tril_indices(len(matrix))
+
+    # the rows with negative m and, within a degree, those with m + m' < 0
+    remaining = (emm[rows] < 0) | (
+        (ell[rows] == ell[cols]) & (emm[rows] + emm[cols] < 0)
+    )
+    rows, cols = rows[remaining], cols[remaining]
+
+    conjugate_rows, conjugate_cols = conjugate[rows], conjugate[cols]
+    lower = conjugate_rows >= conjugate_cols
+    values = matrix[
+        np.where(lower, conjugate_rows, conjugate_cols),
+        np.where(lower, conjugate_cols, conjugate_rows),
+    ]
+    matrix[rows, cols] = (-1) ** np.abs(emm[rows] + emm[cols]) * np.where(
+        lower,
+        values.conj(),
+        values,
+    )
+
+
 def compute_mesh_shannon(mesh: "sleplet.meshes.mesh.Mesh") -> int:
     """Compute the effective Shannon number for a region of a mesh."""
     num_basis_fun = mesh.mesh_eigenvalues.shape[0]
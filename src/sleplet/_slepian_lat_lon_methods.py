@@ -0,0 +1,74 @@
+import functools
+
+import numpy as np
+import numpy.typing as npt
+
+_CACHE_SIZE = 16
+
+
+@functools.lru_cache(maxsize=_CACHE_SIZE)
+def calc_phi_integrals(
+    L: int,
+    phi_min: float,
+    phi_max: float,
+) -> npt.NDArray[np.complex128]:
+    """
+    Compute the integrals of exp(i r phi) over the longitudes of the region
+    for every row r = m - q = -2(L-1), ..., 2(L-1) of the sub-integral matrix.
+    """
+    row = np.arange(-2 * (L - 1), 2 * (L - 1) + 1)
+    S = np.full(len(row), phi_max - phi_min, dtype=np.complex128)
+    nonzero = row != 0
+    r = row[nonzero]
+    S[nonzero] = (1j / r) * (np.exp(1j * r * phi_min) - np.exp(1j * r * phi_max))
+    S.setflags(write=False)
+    return S
+
+
+@functools.lru_cache(maxsize=_CACHE_SIZE)
+def calc_theta_integrals(
+    L: int,
+    theta_min: float,
+    theta_max: float,
+) -> npt.NDArray[np.complex128]:
+    """
+    Compute the integrals of exp(i c theta) sin(theta) over the colatitudes
+    of the region for every column c = -2(L-1), ..., 2(L-1) of the sub-integral
+    matrix, where the columns c = +/-1 have their own closed form.
+    """
+    col = np.arange(-2 * (L - 1), 2 * (L - 1) + 1)
+    Q = np.empty(len(col), dtype=np.complex128)
+    singular = np.abs(col) == 1
+    c = col[~singular]
+    Q[~singular] = (1 / (c**2 - 1)) * (
+        np.exp(1j * c * theta_min) * (1j * c * np.sin(theta_min) - np.cos(theta_min))
+        + np.exp(1j * c * theta_max) * (np.cos(theta_max) - 1j * c * np.sin(theta_max))
+    )
+    c = col[singular]
+    Q[singular] = 0.25 * (
+        2 * 1j * c * (theta_max - theta_min)
+        + np.exp(2 * 1j * c * theta_min)
+        - np.exp(2 * 1j * c * theta_max)
+    )
+    Q.setflags(write=False)
+    return Q
+
+
+@functools.lru_cache(maxsize=_CACHE_SIZE)
+def create_sub_integral_matrix(
+    L: int,
+    theta_range: tuple[float, float],
+    phi_range: tuple[float, float],
+) -> npt.NDArray[np.complex128]:
+    """
+    Create the sub-integral matrix of a limited colatitude-longitude region,
+    which separates into the outer product of the integrals over phi of each
+    row and over theta of each column. The matrix is cached so that it is
+    shared between regions with the same ranges and bandlimit.
+    """
+    G = np.outer(
+        calc_phi_integrals(L, *phi_range),
+        calc_theta_integrals(L, *theta_range),
+    )
+    G.setflags(write=False)
+    return G
@@ -83,6 +83,18 @@ def wavelet_ending(j_min: int, j: int | None) -> str:
     return "_scaling" if j is None else f"{filename_args(j + j_min, 'j')}"
 
 
+def convert_memory_to_bytes(memory: int | str) -> int:
+    """Convert a memory size such as `8GB` to a number of bytes."""
+    if isinstance(memory, int):
+        return memory
+    match = re.fullmatch(r"(\d+(?:\.\d+)?)([KMGT]?B)", memory.replace(" ", "").upper())
+    if match is None:
+        msg = f"memory '{memory}' should be of the form '8GB'"
+        raise ValueError(msg)
+    value, unit = match.groups()
+    return int(float(value) * 1024 ** "BKMGT".index(unit[0]))
+
+
 def _convert_camel_case_to_snake_case(name: str) -> str:
     """Convert a string in camel case to snake case."""
     return re.sub(r"(?<!^)(?=[A-Z])", "_", name).lower()
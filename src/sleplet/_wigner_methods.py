@@ -0,0 +1,136 @@
+import functools
+
+import numba
+import numpy as np
+import numpy.typing as npt
+
+_RESCALE = 1e100
+_TABLE_CACHE_SIZE = 2
+
+
+@functools.lru_cache(maxsize=_TABLE_CACHE_SIZE)
+def wigner3j_zero_order_table(L: int) -> npt.NDArray[np.float64]:
+    """
+    Compute the Wigner 3j symbols (l1 l2 l3; 0 0 0) for all l1, l2 < L, the
+    table is cached as it is shared between the orders.
+    """
+    table = _wigner3j_zero_order_table(L)
+    table.setflags(write=False)
+    return table
+
+
+@numba.njit(cache=True, nogil=True)
+def _wigner3j_zero_order_table(L: int) -> npt.NDArray[np.float64]:
+    """
+    Only the symbols with l1 + l2 + l3 even are non-zero, so the table holds
+    l3 = |l1 - l2| + 2k at [l1, l2, k].
+    """
+    table = np.zeros((L, L, L))
+    for l1 in range(L):
+        for l2 in range(l1, L):
+            _, s = _wigner3j_recursion(l1, l2, 0, 0)
+            table[l1, l2, : (len(s) + 1) // 2] = s[::2]
+            table[l2, l1] = table[l1, l2]
+    return table
+
+
+@numba.njit(cache=True, nogil=True)
+def _wigner3j_recursion(
+    l1: int,
+    l2: int,
+    m1: int,
+    m2: int,
+) -> tuple[int, npt.NDArray[np.float64]]:
+    """
+    Compute the Wigner 3j symbols over l3 with the three-term recursion of
+    Schulten & Gordon (1975). The recursion is run forwards from the lowest l3
+    while the symbols grow and backwards from the highest l3 through the rest,
+    so that each direction is only used where it is stable, and the two are
+    matched where they meet. The result is then normalised by
+    sum_l3 (2 l3 + 1) s^2 = 1 with the sign of the highest l3 (-1)^(l1-l2-m3).
+    """
+    m3 = -m1 - m2
+    l3_min = max(abs(l1 - l2), abs(m3))
+    l3_max = l1 + l2
+    n = l3_max - l3_min + 1
+    if abs(m1) > l1 or abs(m2) > l2 or n <= 0:
+        return l3_min, np.zeros(max(n, 0))
+
+    s = np.zeros(n)
+    if n == 1:
+        s[0] = 1.0
+        return l3_min, _normalise_wigner3j(s, l1, l2, m3, l3_min)
+
+    # forwards until the symbols stop growing, if all the orders are zero then
+    # the recursion reduces to two terms which is stable throughout
+    s[0] = 1.0
+    if l3_min == 0:
+        s[1] = m1 / np.sqrt(l1 * (l1 + 1.0))
+    else:
+        s[1] = -_b(l1, l2, m1, m2, l3_min) / (l3_min * _a(l1, l2, m3, l3_min + 1))
+    growing = m1 != 0 or m2 != 0
+    k = 1
+    while k < n - 1 and (not growing or abs(s[k]) >= abs(s[k - 1])):
+        l3 = l3_min + k
+        s[k + 1] = -(
+            _b(l1, l2, m1, m2, l3) * s[k] + (l3 + 1) * _a(l1, l2, m3, l3) * s[k - 1]
+        ) / (l3 * _a(l1, l2, m3, l3 + 1))
+        k += 1
+        if abs(s[k]) > _RESCALE:
+            s[: k + 1] /= _RESCALE
+    if k == n - 1:
+        return l3_min, _normalise_wigner3j(s, l1, l2, m3, l3_min)
+
+    # backwards to the overlap with the forward recursion
+    t = np.zeros(n)
+    t[n - 1] = 1.0
+    t[n - 2] = -_b(l1, l2, m1, m2, l3_max) / ((l3_max + 1) * _a(l1, l2, m3, l3_max))
+    for i in range(n - 2, k - 1, -1):
+        l3 = l3_min + i
+        t[i - 1] = -(
+            l3 * _a(l1, l2, m3, l3 + 1) * t[i + 1] + _b(l1, l2, m1, m2, l3) * t[i]
+        ) / ((l3 + 1) * _a(l1, l2, m3, l3))
+        if abs(t[i - 1]) > _RESCALE:
+            t[i - 1 :] /= _RESCALE
+
+    # match the two recursions over the overlapping symbols
+    overlap = slice(k - 1, k + 1)
+    scale = (s[overlap] * t[overlap]).sum() / (t[overlap] ** 2).sum()
+    s[k + 1 :] = scale * t[k + 1 :]
+    return l3_min, _normalise_wigner3j(s, l1, l2, m3, l3_min)
+
+
+@numba.njit(cache=True, nogil=True)
+def _a(l1: int, l2: int, m3: int, l3: int) -> float:
+    """Compute the A(l3) coefficient of the Wigner 3j recursion."""
+    return np.sqrt(
+        float(l3**2 - (l1 - l2) ** 2)
+        * float((l1 + l2 + 1) ** 2 - l3**2)
+        * float(l3**2 - m3**2),
+    )
+
+
+@numba.njit(cache=True, nogil=True)
+def _b(l1: int, l2: int, m1: int, m2: int, l3: int) -> float:
+    """Compute the B(l3) coefficient of the Wigner 3j recursion."""
+    m3 = -m1 - m2
+    return -(2 * l3 + 1.0) * (
+        float(l1 * (l1 + 1) - l2 * (l2 + 1)) * m3 - float(l3 * (l3 + 1)) * (m2 - m1)
+    )
+
+
+@numba.njit(cache=True, nogil=True)
+def _normalise_wigner3j(
+    s: npt.NDArray[np.float64],
+    l1: int,
+    l2: int,
+    m3: int,
+    l3_min: int,
+) -> npt.NDArray[np.float64]:
+    """Normalise the symbols and fix the sign by the highest l3."""
+    l3 = np.arange(l3_min, l3_min + len(s))
+    norm = np.sqrt(((2 * l3 + 1) * s**2).sum())
+    sign = 1.0 if (l1 - l2 - m3) % 2 == 0 else -1.0
+    if s[-1] * sign < 0:
+        norm = -norm
+    return s / norm
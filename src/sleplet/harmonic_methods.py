@@ -8,7 +8,6 @@ import numpy.typing as npt
 
 import pyssht as ssht
 
-import sleplet._integration_methods
 import sleplet._vars
 import sleplet.meshes.mesh
 
@@ -134,26 +133,21 @@ def compute_random_signal(
 def mesh_forward(
     mesh: "sleplet.meshes.mesh.Mesh",
     u: npt.NDArray[np.complex128 | np.float64],
-) -> npt.NDArray[np.float64]:
+) -> npt.NDArray[np.complex128 | np.float64]:
     """
     Compute the mesh forward transform from pixel space to Fourier space.
 
     Args:
         mesh: The given mesh object.
-        u: The signal field value on the mesh.
+        u: The signal field value on the mesh, or a stack of signals with
+            one per row.
 
     Returns:
-        The basis functions of the mesh in Fourier space.
+        The basis functions of the mesh in Fourier space, with one row per
+        signal if a stack is given.
     """
-    u_i = np.zeros(mesh.mesh_eigenvalues.shape[0])
-    for i, phi_i in enumerate(mesh.basis_functions):
-        u_i[i] = sleplet._integration_methods.integrate_whole_mesh(
-            mesh.vertices,
-            mesh.faces,
-            u,
-            phi_i,
-        )
-    return u_i
+    # the integral over the mesh is the sum over the vertices
+    return u @ mesh.basis_functions.T
 
 
 def mesh_inverse(
@@ -165,12 +159,14 @@ def mesh_inverse(
 
     Args:
         mesh: The given mesh object.
-        u_i: The Fourier coefficients on the mesh.
+        u_i: The Fourier coefficients on the mesh, or a stack of coefficients
+            with one per row.
 
     Returns:
-        The values on the mesh in pixel space.
+        The values on the mesh in pixel space, with one row per set of
+        coefficients if a stack is given.
     """
-    return (u_i[:, np.newaxis] * mesh.basis_functions).sum(axis=0)
+    return u_i @ mesh.basis_functions
 
 
 def rotate_earth_to_south_america(
@@ -44,12 +44,47 @@ class MeshSlepianDecomposition:
     def decompose_all(
         self: typing_extensions.Self,
         n_coefficients: int,
-    ) -> npt.NDArray[np.float64]:
-        """Decompose all ranks of the Slepian coefficients."""
-        coefficients = np.zeros(n_coefficients)
-        for rank in range(n_coefficients):
-            coefficients[rank] = self.decompose(rank)
-        return coefficients
+    ) -> npt.NDArray[np.complex128 | np.float64]:
+        """
+        Decompose all ranks of the Slepian coefficients via the given method,
+        which is a matrix product over the ranks. The signal may be a stack of
+        signals with one per row, in which case there is a row of coefficients
+        for each signal.
+        """
+        self._validate_rank(n_coefficients - 1)
+        slepian_functions = self.mesh_slepian.slepian_functions[:n_coefficients]
+
+        match self._method:
+            case "harmonic_sum" if self.u_i is not None:
+                return self.u_i @ slepian_functions.T
+            case "integrate_mesh" if self.u is not None:
+                return (
+                    sleplet.harmonic_methods.mesh_forward(
+                        self.mesh_slepian.mesh,
+                        self.u,
+                    )
+                    @ slepian_functions.T
+                )
+            case "integrate_region" if self.u is not None:
+                return (
+                    self._integrate_region_basis_functions(self.u) @ slepian_functions.T
+                ) / self.mesh_slepian.slepian_eigenvalues[:n_coefficients]
+            case _:
+                msg = f"'{self._method}' is not a valid method"
+                raise ValueError(msg)
+
+    def _integrate_region_basis_functions(
+        self: typing_extensions.Self,
+        u: npt.NDArray[np.complex128 | np.float64],
+    ) -> npt.NDArray[np.complex128 | np.float64]:
+        """
+        Integrate the signal against every basis function of the mesh over the
+        region, from which the Slepian coefficients follow by a matrix product.
+        """
+        indices = self.mesh_slepian._region_indices
+        return (u[..., indices] * self.mesh_slepian._region_weights) @ (
+            self.mesh_slepian.mesh.basis_functions[:, indices].T
+        )
 
     def _integrate_region(self: typing_extensions.Self, rank: int) -> float:
         r"""
@@ -62,10 +97,9 @@ class MeshSlepianDecomposition:
             self.mesh_slepian.mesh,
             self.mesh_slepian.slepian_functions[rank],
         )
-        integration = sleplet._integration_methods.integrate_region_mesh(
-            self.mesh_slepian.mesh.mesh_region,
-            self.mesh_slepian.mesh.vertices,
-            self.mesh_slepian.mesh.faces,
+        integration = sleplet._integration_methods.integrate_compressed_region(
+            self.mesh_slepian._region_indices,
+            self.mesh_slepian._region_weights,
             self.u,
             s_p,
         )
@@ -24,6 +24,13 @@ class Mesh:
     number_basis_functions: int | None = None
     """The number of basis functions to compute from the Laplacian of the given
     mesh. Defaults to one quarter of the number of vertices o the given mesh."""
+    eigensolver: str = "shift_invert"
+    """How the basis functions are found when they aren't already cached. By
+    default (i.e. `shift_invert`) the Laplacian is factorised once and reused
+    by the shift-invert solver. If `lobpcg` then an iterative solver with an
+    incomplete LU preconditioner is used, which suits large meshes with few
+    basis functions. If `slicing` then the spectrum is split into windows
+    which are solved in parallel."""
     zoom: bool = False
     """Whether to zoom in on the pre-selected region of the mesh in the
     plots."""
@@ -89,4 +96,15 @@ class Mesh:
             self.vertices,
             self.faces,
             number_basis_functions=self.number_basis_functions,
+            eigensolver=self.eigensolver,
         )
+
+    @pydantic.field_validator("eigensolver")
+    def _check_eigensolver(
+        cls,
+        v: str,
+    ) -> str:
+        if v not in {"lobpcg", "shift_invert", "slicing"}:
+            msg = "eigensolver should be one of 'lobpcg', 'shift_invert' or 'slicing'"
+            raise ValueError(msg)
+        return v
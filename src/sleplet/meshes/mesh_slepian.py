@@ -1,8 +1,7 @@
 """Contains the `MeshSlepian` class."""
 
-import concurrent.futures
+import dataclasses
 import logging
-import os
 
 import numpy as np
 import numpy.linalg as LA  # noqa: N812
@@ -16,7 +15,9 @@ import sleplet._data.setup_pooch
 import sleplet._integration_methods
 import sleplet._parallel_methods
 import sleplet._slepian_arbitrary_methods
+import sleplet._string_methods
 import sleplet._validation
+import sleplet.harmonic_methods
 from sleplet.meshes.mesh import Mesh
 
 _logger = logging.getLogger(__name__)
@@ -28,6 +29,24 @@ class MeshSlepian:
 
     mesh: Mesh
     """A mesh object."""
+    _: dataclasses.KW_ONLY
+    assembly: str = "product"
+    """
+    How the Slepian matrix is assembled. By default (i.e. `product`) the
+    basis functions are restricted to the vertices of the region and the
+    matrix is formed by a single weighted matrix product. If `integral` then
+    each element is computed as a separate integral over the mesh."""
+    max_memory: int | str | None = None
+    """
+    The memory budget (e.g. `1GB`) for holding the Slepian functions in pixel
+    space. By default (i.e. `None`) they are held once they have been
+    computed, otherwise they are only held if they fit within the budget and
+    are recomputed whenever they are needed."""
+    save_pixels: bool = False
+    """
+    Whether to save the Slepian functions in pixel space next to the cached
+    eigenvectors. The saved functions are memory-mapped rather than held, so
+    they don't count towards `max_memory`."""
     N: int = pydantic.Field(default=0, init_var=False, repr=False)
     slepian_eigenvalues: npt.NDArray[np.float64] = pydantic.Field(
         default_factory=lambda: np.empty(0),
@@ -39,9 +58,31 @@ class MeshSlepian:
         init_var=False,
         repr=False,
     )
+    _pixel_loc: str = pydantic.Field(default="", init_var=False, repr=False)
+    _region_indices: npt.NDArray[np.int_] = pydantic.Field(
+        default_factory=lambda: np.empty(0, dtype=np.int_),
+        init_var=False,
+        repr=False,
+    )
+    _region_weights: npt.NDArray[np.float64] = pydantic.Field(
+        default_factory=lambda: np.empty(0),
+        init_var=False,
+        repr=False,
+    )
+    _slepian_functions_pixel: npt.NDArray[np.complex128 | np.float64] | None = (
+        pydantic.Field(
+            default=None,
+            init_var=False,
+            repr=False,
+        )
+    )
 
     def __post_init__(self: typing_extensions.Self) -> None:
         self.N = sleplet._slepian_arbitrary_methods.compute_mesh_shannon(self.mesh)
+        (
+            self._region_indices,
+            self._region_weights,
+        ) = sleplet._integration_methods.compress_region(self.mesh.mesh_region)
         self._compute_slepian_functions()
 
     def _compute_slepian_functions(self: typing_extensions.Self) -> None:
@@ -55,6 +96,7 @@ class MeshSlepian:
         )
         eval_loc = f"{eigd_loc}_eigenvalues.npy"
         evec_loc = f"{eigd_loc}_eigenvectors.npy"
+        self._pixel_loc = f"{eigd_loc}_pixels.npy"
 
         try:
             self.slepian_eigenvalues = np.load(
@@ -93,8 +135,76 @@ class MeshSlepian:
             self.slepian_functions[: self.N],
         )
 
+    @property
+    def slepian_functions_pixel(
+        self: typing_extensions.Self,
+    ) -> npt.NDArray[np.complex128 | np.float64]:
+        """
+        The first N Slepian functions in pixel space, with one function per
+        row. They are computed on first use and then held within the memory
+        budget.
+        """
+        if self._slepian_functions_pixel is not None:
+            return self._slepian_functions_pixel
+        s_p = (
+            self._load_slepian_functions_pixel()
+            if self.save_pixels
+            else self._create_slepian_functions_pixel()
+        )
+        if (
+            self.save_pixels
+            or self.max_memory is None
+            or s_p.nbytes
+            <= sleplet._string_methods.convert_memory_to_bytes(self.max_memory)
+        ):
+            self._slepian_functions_pixel = s_p
+        return s_p
+
+    def _load_slepian_functions_pixel(
+        self: typing_extensions.Self,
+    ) -> npt.NDArray[np.complex128 | np.float64]:
+        """Memory-map the saved Slepian functions in pixel space."""
+        pixel_path = sleplet._data.setup_pooch.find_on_pooch_then_local(self._pixel_loc)
+        if pixel_path is None:
+            pixel_path = platformdirs.user_data_path() / self._pixel_loc
+            np.save(pixel_path, self._create_slepian_functions_pixel())
+        return np.load(pixel_path, mmap_mode="r")
+
+    def _create_slepian_functions_pixel(
+        self: typing_extensions.Self,
+    ) -> npt.NDArray[np.complex128 | np.float64]:
+        """Compute the Slepian functions in pixel space with one matrix product."""
+        return sleplet.harmonic_methods.mesh_inverse(
+            self.mesh,
+            self.slepian_functions[: self.N],
+        )
+
     def _create_D_matrix(  # noqa: N802
         self: typing_extensions.Self,
+    ) -> npt.NDArray[np.float64]:
+        """Compute the D matrix via the chosen assembly method."""
+        match self.assembly:
+            case "product":
+                return self._create_D_matrix_product()
+            case "integral":
+                return self._create_D_matrix_integral()
+            case _:
+                msg = f"'{self.assembly}' is not a valid assembly method"
+                raise ValueError(msg)
+
+    def _create_D_matrix_product(  # noqa: N802
+        self: typing_extensions.Self,
+    ) -> npt.NDArray[np.float64]:
+        r"""
+        Compute the D matrix as \(D = B_{R} W B_{R}^{T}\) where the columns of
+        \(B_{R}\) are the mesh basis functions at the vertices of the region
+        and \(W\) is the diagonal matrix of the integration weights.
+        """
+        basis_region = self.mesh.basis_functions[:, self._region_indices]
+        return (basis_region * self._region_weights) @ basis_region.T
+
+    def _create_D_matrix_integral(  # noqa: N802
+        self: typing_extensions.Self,
     ) -> npt.NDArray[np.float64]:
         """Compute the D matrix for the mesh eigenfunctions."""
         D = np.zeros(
@@ -120,17 +230,14 @@ class MeshSlepian:
             sleplet._parallel_methods.free_shared_memory(shm_int)
 
         # split up L range to maximise efficiency
-        ncpu = int(os.getenv("NCPU", "4"))
-        msg = f"Number of CPU={ncpu}"
-        _logger.info(msg)
+        ncpu = sleplet._parallel_methods.get_ncpu()
         chunks = sleplet._parallel_methods.split_arr_into_chunks(
             self.mesh.mesh_eigenvalues.shape[0],
             ncpu,
         )
 
-        # initialise pool and apply function
-        with concurrent.futures.ThreadPoolExecutor(max_workers=ncpu) as e:
-            e.map(func, chunks)
+        # apply function to each chunk with the chosen backend
+        sleplet._parallel_methods.run_chunks_in_parallel(func, chunks, ncpu)
 
         # retrieve from parallel function
         D = D_ext.copy()
@@ -152,13 +259,32 @@ class MeshSlepian:
 
     def _integral(self: typing_extensions.Self, i: int, j: int) -> float:
         """Calculate the D integral between two mesh basis functions."""
-        return sleplet._integration_methods.integrate_region_mesh(
-            self.mesh.mesh_region,
-            self.mesh.vertices,
-            self.mesh.faces,
+        return sleplet._integration_methods.integrate_compressed_region(
+            self._region_indices,
+            self._region_weights,
             self.mesh.basis_functions[i],
             self.mesh.basis_functions[j],
-        )
+        ).real
+
+    @pydantic.field_validator("max_memory")
+    def _check_max_memory(
+        cls,
+        v: int | str | None,
+    ) -> int | str | None:
+        if v is not None and sleplet._string_methods.convert_memory_to_bytes(v) <= 0:
+            msg = "max_memory should be positive"
+            raise ValueError(msg)
+        return v
+
+    @pydantic.field_validator("assembly")
+    def _check_assembly(
+        cls,
+        v: str,
+    ) -> str:
+        if v not in {"integral", "product"}:
+            msg = "assembly should be one of 'integral' or 'product'"
+            raise ValueError(msg)
+        return v
 
     @staticmethod
     def _clean_evals_and_evecs(
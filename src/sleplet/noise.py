@@ -142,7 +142,7 @@ def harmonic_hard_thresholding(
     """
     _logger.info("begin harmonic hard thresholding")
     for j, coefficient in enumerate(wav_coeffs[1:]):
-        msg = f"start Psi^{j + 1}/{len(wav_coeffs)-1}"
+        msg = f"start Psi^{j + 1}/{len(wav_coeffs) - 1}"
         _logger.info(msg)
         f = ssht.inverse(coefficient, L, Method=sleplet._vars.SAMPLING_SCHEME)
         f_thresholded = _perform_hard_thresholding(f, sigma_j[j], n_sigma)
@@ -264,7 +264,7 @@ def _create_slepian_mesh_noise(
     mesh_slepian: "sleplet.meshes.mesh_slepian.MeshSlepian",
     slepian_signal: npt.NDArray[np.complex128 | np.float64],
     snr_in: float,
-) -> npt.NDArray[np.float64]:
+) -> npt.NDArray[np.complex128 | np.float64]:
     """Compute Gaussian white noise in Slepian space."""
     u_i = sleplet.harmonic_methods.mesh_forward(
         mesh_slepian.mesh,
@@ -303,9 +303,10 @@ def compute_slepian_mesh_sigma_j(
         snr_in,
         denominator=mesh_slepian.slepian_eigenvalues.shape[0],
     )
-    s_p = sleplet.slepian_methods._compute_mesh_s_p_pixel(mesh_slepian)
-    psi_j_reshape = psi_j[:, : mesh_slepian.N, np.newaxis]
-    wavelet_power = (np.abs(psi_j_reshape) ** 2 * np.abs(s_p) ** 2).sum(axis=1)
+    wavelet_power = (
+        np.abs(psi_j[:, : mesh_slepian.N]) ** 2
+        @ np.abs(mesh_slepian.slepian_functions_pixel) ** 2
+    )
     return sigma_noise * np.sqrt(wavelet_power)
 
 
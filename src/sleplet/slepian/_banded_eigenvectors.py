@@ -0,0 +1,65 @@
+import numpy as np
+import numpy.typing as npt
+import pydantic
+import typing_extensions
+
+import sleplet._validation
+
+
+@pydantic.dataclasses.dataclass(config=sleplet._validation.validation)
+class BandedEigenvectors:
+    """
+    Eigenvectors which are each non-zero for a single order m, such as those
+    of the polar cap. Only the band of degrees l = 0, ..., L-1 of each order
+    is held and the eigenvectors are expanded to the full L^2 harmonic
+    coefficients when indexed.
+    """
+
+    L: int
+    bands: npt.NDArray[np.complex128]
+    orders: npt.NDArray[np.int_]
+
+    def __getitem__(
+        self: typing_extensions.Self,
+        index: int | slice | npt.NDArray[np.bool_ | np.int_],
+    ) -> npt.NDArray[np.complex128]:
+        """Expand the indexed eigenvectors to their harmonic coefficients."""
+        orders = np.atleast_1d(self.orders[index])
+        bands = np.atleast_2d(self.bands[index])
+        rows, ell = np.nonzero(np.arange(self.L) >= np.abs(orders)[:, np.newaxis])
+        eigenvectors = np.zeros((len(orders), self.L**2), dtype=np.complex128)
+        eigenvectors[rows, ell * (ell + 1) + orders[rows]] = bands[rows, ell]
+        return eigenvectors[0] if np.ndim(self.orders[index]) == 0 else eigenvectors
+
+    def __len__(self: typing_extensions.Self) -> int:
+        return len(self.orders)
+
+    @property
+    def shape(self: typing_extensions.Self) -> tuple[int, int]:
+        """The shape of the expanded eigenvectors."""
+        return len(self), self.L**2
+
+    @classmethod
+    def from_dense(
+        cls: type[typing_extensions.Self],
+        eigenvectors: npt.NDArray[np.complex128],
+        orders: npt.NDArray[np.int_],
+    ) -> typing_extensions.Self:
+        """Keep the band of the order of each of the dense eigenvectors."""
+        L = round(np.sqrt(eigenvectors.shape[1]))
+        orders = orders[: len(eigenvectors)]
+        ell = np.arange(L)
+        indices = np.clip(ell * (ell + 1) + orders[:, np.newaxis], 0, L**2 - 1)
+        bands = np.where(
+            ell >= np.abs(orders)[:, np.newaxis],
+            np.take_along_axis(eigenvectors, indices, axis=1),
+            0,
+        )
+        return cls(L, bands, orders)
+
+    def select(
+        self: typing_extensions.Self,
+        index: slice | npt.NDArray[np.bool_ | np.int_],
+    ) -> typing_extensions.Self:
+        """Select a subset of the eigenvectors whilst keeping them banded."""
+        return type(self)(self.L, self.bands[index], self.orders[index])
@@ -25,9 +25,27 @@ class SlepianDecomposition:
     flm: npt.NDArray[np.complex128 | np.float64] | None = None
     mask: npt.NDArray[np.float64] | None = None
     _method: str = pydantic.Field(default="", init_var=False, repr=False)
+    _region_indices: npt.NDArray[np.int_] = pydantic.Field(
+        default_factory=lambda: np.empty(0, dtype=np.int_),
+        init_var=False,
+        repr=False,
+    )
+    _region_weights: npt.NDArray[np.float64] = pydantic.Field(
+        default_factory=lambda: np.empty(0),
+        init_var=False,
+        repr=False,
+    )
 
     def __post_init__(self: typing_extensions.Self) -> None:
         self._detect_method()
+        if self._method == "integrate_region":
+            (
+                self._region_indices,
+                self._region_weights,
+            ) = sleplet._integration_methods.compress_region(
+                self.mask,
+                sleplet._integration_methods.calc_integration_weight(self.L),
+            )
 
     def decompose(self: typing_extensions.Self, rank: int) -> complex:
         """Decompose the signal into its Slepian coefficients via the given method."""
@@ -66,10 +84,9 @@ class SlepianDecomposition:
             self.L,
             Method=sleplet._vars.SAMPLING_SCHEME,
         )
-        weight = sleplet._integration_methods.calc_integration_weight(self.L)
-        integration = sleplet._integration_methods.integrate_region_sphere(
-            self.mask,
-            weight,
+        integration = sleplet._integration_methods.integrate_compressed_region(
+            self._region_indices,
+            self._region_weights,
             self.f,
             s_p.conj(),
         )
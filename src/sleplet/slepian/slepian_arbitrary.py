@@ -1,11 +1,11 @@
 """Contains the `SlepianArbitrary` class."""
 
-import concurrent.futures
+import dataclasses
 import logging
-import os
+import pathlib
+import re
 
 import numpy as np
-import numpy.linalg as LA  # noqa: N812
 import numpy.typing as npt
 import platformdirs
 import pydantic
@@ -14,11 +14,14 @@ import typing_extensions
 import pyssht as ssht
 
 import sleplet._array_methods
+import sleplet._checkpoint_methods
 import sleplet._data.setup_pooch
 import sleplet._integration_methods
 import sleplet._mask_methods
+import sleplet._operator_methods
 import sleplet._parallel_methods
 import sleplet._slepian_arbitrary_methods
+import sleplet._string_methods
 import sleplet._validation
 import sleplet.harmonic_methods
 import sleplet.slepian.region
@@ -26,6 +29,7 @@ from sleplet.slepian.slepian_functions import SlepianFunctions
 
 _logger = logging.getLogger(__name__)
 
+_CHECKPOINT_COLUMNS = 32
 _SAMPLES = 2
 
 
@@ -35,14 +39,67 @@ class SlepianArbitrary(SlepianFunctions):
 
     mask_name: str
     """The name of the mask of the arbitrary region."""
+    _: dataclasses.KW_ONLY
+    assembly: str = "product"
+    """
+    How the Slepian matrix is assembled. By default (i.e. `product`) every
+    spherical harmonic is sampled within the region and the matrix is formed by
+    a single weighted Hermitian matrix product. If `integral` then each element
+    is computed as a separate integral over the sphere."""
+    max_memory: int | str | None = None
+    """
+    The memory budget (e.g. `8GB`) for the sampled harmonics when using the
+    `product` assembly. By default (i.e. `None`) all harmonics are held at
+    once, otherwise the matrix is built in blocks of rows and columns whose
+    harmonics are sampled on the fly. The matrix itself is not included in
+    the budget."""
+    resolution: int | None = None
+    """
+    The resolution of the samples used to compute the Slepian matrix. By
+    default (i.e. `None`) the signals are sampled at `2L` and integrated with
+    the sin(theta) Riemann weights, as for the precomputed data. Otherwise the
+    exact MWSS quadrature weights are used, which integrate the product of two
+    signals over the whole sphere exactly for resolutions of at least `2L-2`.
+    The native `L` grid is the cheapest but as the products of two signals are
+    not resolved their integrals are approximate, so the concentrations of the
+    eigenvalues may exceed one."""
+    incremental: bool = False
+    """
+    Whether to extend the cached Slepian matrix of the largest lower bandlimit
+    at the same `resolution`, so that only the rows and columns of the new
+    degrees are computed. The matrix is then cached for later extensions. This
+    requires an explicit `resolution` and the `product` assembly, as otherwise
+    the lower bandlimit matrix is not a sub-block of the new matrix."""
+    symmetric: bool = True
+    """
+    Whether to exploit the conjugate symmetry between the orders `m` and `-m`
+    of a real region, in which case only the elements which can't be recovered
+    from this symmetry or the Hermitian symmetry are computed."""
+    _fields: dict[int, npt.NDArray[np.complex128 | np.float64]] = pydantic.Field(
+        default_factory=dict,
+        init_var=False,
+        repr=False,
+    )
     _weight: npt.NDArray[np.float64] = pydantic.Field(
         default_factory=lambda: np.empty(0),
         init_var=False,
         repr=False,
     )
+    _region_indices: npt.NDArray[np.int_] = pydantic.Field(
+        default_factory=lambda: np.empty(0, dtype=np.int_),
+        init_var=False,
+        repr=False,
+    )
+    _region_weights: npt.NDArray[np.float64] = pydantic.Field(
+        default_factory=lambda: np.empty(0),
+        init_var=False,
+        repr=False,
+    )
 
     def __post_init__(self: typing_extensions.Self) -> None:
-        self._resolution = _SAMPLES * self.L
+        self._resolution = (
+            _SAMPLES * self.L if self.resolution is None else self.resolution
+        )
         super().__post_init__()
 
     def _create_fn_name(self: typing_extensions.Self) -> str:
@@ -55,13 +112,24 @@ class SlepianArbitrary(SlepianFunctions):
         return sleplet._mask_methods.create_mask_region(self._resolution, self.region)
 
     def _calculate_area(self: typing_extensions.Self) -> float:
-        self._weight = sleplet._integration_methods.calc_integration_weight(
-            self._resolution,
+        self._weight = (
+            sleplet._integration_methods.calc_integration_weight(self._resolution)
+            if self.resolution is None
+            else sleplet._integration_methods.calc_exact_integration_weight(
+                self._resolution,
+            )
         )
-        return (self.mask * self._weight).sum()
+        (
+            self._region_indices,
+            self._region_weights,
+        ) = sleplet._integration_methods.compress_region(self.mask, self._weight)
+        return self._region_weights.sum()
 
     def _create_matrix_location(self: typing_extensions.Self) -> str:
-        return f"slepian_eigensolutions_D_{self.mask_name}_L{self.L}_N{self.N}"
+        location = f"slepian_eigensolutions_D_{self.mask_name}_L{self.L}_N{self.N}"
+        return (
+            location if self.resolution is None else f"{location}_res{self.resolution}"
+        )
 
     def _solve_eigenproblem(
         self: typing_extensions.Self,
@@ -85,26 +153,203 @@ class SlepianArbitrary(SlepianFunctions):
         eval_loc: str,
         evec_loc: str,
     ) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.complex128]]:
-        D = self._create_D_matrix()
-
-        # fill in remaining triangle section
-        sleplet._array_methods.fill_upper_triangle_of_hermitian_matrix(D)
+        if self.eigensolver == "iterative":
+            # the operator is the complex conjugate of the D matrix
+            eigenvalues, eigenvectors = self._solve_hermitian_eigenproblem(
+                sleplet._operator_methods.create_concentration_operator(
+                    self.L,
+                    self._resolution,
+                    self.mask * self._weight,
+                ),
+            )
+            eigendecomposition = (
+                eigenvalues,
+                eigenvectors.conj().astype(np.complex128, copy=False),
+            )
+        else:
+            D = self._create_D_matrix()
+
+            # fill in remaining triangle section
+            sleplet._array_methods.fill_upper_triangle_of_hermitian_matrix(D)
+            if self.incremental:
+                np.save(
+                    platformdirs.user_data_path()
+                    / f"{self._create_matrix_location()}_D.npy",
+                    D,
+                )
+            eigenvalues, eigenvectors = self._solve_hermitian_eigenproblem(D)
+            eigendecomposition = (
+                eigenvalues,
+                eigenvectors.astype(np.complex128, copy=False),
+            )
 
         # solve eigenproblem
         (
             eigenvalues,
             eigenvectors,
-        ) = sleplet._slepian_arbitrary_methods.clean_evals_and_evecs(LA.eigh(D))
+        ) = sleplet._slepian_arbitrary_methods.clean_evals_and_evecs(
+            eigendecomposition,
+        )
         np.save(platformdirs.user_data_path() / eval_loc, eigenvalues)
         np.save(platformdirs.user_data_path() / evec_loc, eigenvectors[: self.N])
+        sleplet._checkpoint_methods.remove_checkpoint_directory(
+            self._find_checkpoint_directory(),
+        )
         return eigenvalues, eigenvectors
 
     def _create_D_matrix(  # noqa: N802
         self: typing_extensions.Self,
+    ) -> npt.NDArray[np.complex128]:
+        """Compute the D matrix via the chosen assembly method."""
+        match self.assembly:
+            case "product":
+                return self._create_D_matrix_product(
+                    self._load_previous_D_matrix() if self.incremental else None,
+                )
+            case "integral":
+                return self._create_D_matrix_integral()
+            case _:
+                msg = f"'{self.assembly}' is not a valid assembly method"
+                raise ValueError(msg)
+
+    def _create_D_matrix_product(  # noqa: N802
+        self: typing_extensions.Self,
+        D_previous: npt.NDArray[np.complex128] | None = None,
+    ) -> npt.NDArray[np.complex128]:
+        r"""
+        Compute the D matrix as \(D = Y^{T} W \overline{Y}\) where the columns of
+        \(Y\) are the spherical harmonics sampled within the region and \(W\) is
+        the diagonal matrix of the integration weights. The lower triangle is
+        built in blocks which fit within the memory budget. With the conjugate
+        symmetry only the harmonics with `m >= 0` are sampled as
+        \(Y_{\ell -m} = (-1)^{m} \overline{Y_{\ell m}}\). If the D matrix of a
+        lower bandlimit is given then only the blocks of the new rows are built.
+        When there is more than one block each is saved as a checkpoint, so that
+        an interrupted build resumes, and these are removed once it's complete.
+        """
+        emm, conjugate = sleplet._slepian_arbitrary_methods.compute_conjugate_indices(
+            self.L,
+        )
+        harmonics = np.flatnonzero(emm >= 0) if self.symmetric else np.arange(self.L**2)
+        n_previous = 0 if D_previous is None else len(D_previous)
+        weight = self._region_weights[:, np.newaxis]
+        tile_size = self._calculate_tile_size(len(weight), len(harmonics))
+        previous_tiles = _split_into_tiles(harmonics[harmonics < n_previous], tile_size)
+        tiles = previous_tiles + _split_into_tiles(
+            harmonics[harmonics >= n_previous],
+            tile_size,
+        )
+        msg = f"sampling {len(harmonics)} harmonics at {len(weight)} pixels"
+        _logger.info(msg)
+        msg = f"building D matrix in {len(tiles)} blocks of {tile_size} harmonics"
+        _logger.info(msg)
+
+        D = np.zeros((self.L**2, self.L**2), dtype=np.complex128)
+        if D_previous is not None:
+            D[:n_previous, :n_previous] = D_previous
+        checkpoint_directory = self._find_checkpoint_directory()
+        checkpointed = len(tiles) - len(previous_tiles) > 1
+        for i, rows in enumerate(tiles[len(previous_tiles) :], len(previous_tiles)):
+            checkpoint = (
+                sleplet._checkpoint_methods.load_checkpoint(
+                    checkpoint_directory,
+                    f"block{i}",
+                )
+                if checkpointed
+                else None
+            )
+            if checkpoint is not None and np.array_equal(checkpoint["rows"], rows):
+                D[rows] = checkpoint["D"]
+                continue
+            msg = f"start block: {i}"
+            _logger.info(msg)
+            Y_rows = self._sample_harmonics(rows)
+            for j, cols in enumerate(tiles[: i + 1]):
+                Y_cols = Y_rows if i == j else self._sample_harmonics(cols)
+                Y_cols_weighted = weight * Y_cols
+                D[np.ix_(rows, cols)] = Y_rows.T @ Y_cols_weighted.conj()
+                if self.symmetric:
+                    D[np.ix_(rows, conjugate[cols])] = (
+                        Y_rows.T @ Y_cols_weighted * (-1) ** emm[cols]
+                    )
+            if checkpointed:
+                sleplet._checkpoint_methods.save_checkpoint(
+                    checkpoint_directory,
+                    f"block{i}",
+                    rows=rows,
+                    D=D[rows],
+                )
+            msg = f"finish block: {i}"
+            _logger.info(msg)
+        sleplet._checkpoint_methods.remove_checkpoint_directory(checkpoint_directory)
+
+        if self.symmetric:
+            sleplet._slepian_arbitrary_methods.fill_matrix_using_conjugate_symmetry(D)
+        return D
+
+    def _load_previous_D_matrix(  # noqa: N802
+        self: typing_extensions.Self,
+    ) -> npt.NDArray[np.complex128] | None:
+        """Load the cached D matrix of the largest bandlimit up to L, if any."""
+        pattern = re.compile(
+            rf"slepian_eigensolutions_D_{re.escape(self.mask_name)}"
+            rf"_L(\d+)_N\d+_res{self.resolution}_D\.npy",
+        )
+        locations = {
+            int(match[1]): path
+            for path in platformdirs.user_data_path().glob("*_D.npy")
+            if (match := pattern.fullmatch(path.name)) and int(match[1]) <= self.L
+        }
+        if not locations:
+            return None
+        L_previous = max(locations)
+        msg = f"extending the D matrix from L={L_previous}"
+        _logger.info(msg)
+        return np.load(locations[L_previous])
+
+    def _find_checkpoint_directory(self: typing_extensions.Self) -> pathlib.Path:
+        """Find the checkpoints of the D matrix for the chosen assembly."""
+        symmetry = "_symmetric" if self.symmetric else ""
+        return sleplet._checkpoint_methods.find_checkpoint_directory(
+            f"{self.matrix_location}_{self.assembly}{symmetry}",
+        )
+
+    def _calculate_tile_size(
+        self: typing_extensions.Self,
+        n_pixels: int,
+        n_harmonics: int,
+    ) -> int:
+        """Find the number of harmonics per block which fit in the memory budget."""
+        if self.max_memory is None:
+            return n_harmonics
+        # the rows, columns, weighted columns and their conjugate are held at once
+        bytes_per_harmonic = 4 * n_pixels * np.dtype(np.complex128).itemsize
+        budget = sleplet._string_methods.convert_memory_to_bytes(self.max_memory)
+        return int(np.clip(budget // bytes_per_harmonic, 1, n_harmonics))
+
+    def _sample_harmonics(
+        self: typing_extensions.Self,
+        indices: npt.NDArray[np.int_],
+    ) -> npt.NDArray[np.complex128]:
+        """Sample the given spherical harmonics at the pixels within the region."""
+        samples = np.empty(
+            (len(self._region_indices), len(indices)),
+            dtype=np.complex128,
+        )
+        for k, i in enumerate(indices):
+            samples[:, k] = sleplet.harmonic_methods.invert_flm_boosted(
+                sleplet.harmonic_methods._create_spherical_harmonic(self.L, i),
+                self.L,
+                self._resolution,
+            ).reshape(-1)[self._region_indices]
+        return samples
+
+    def _create_D_matrix_integral(  # noqa: N802
+        self: typing_extensions.Self,
     ) -> npt.NDArray[np.complex128]:
         """Compute the D matrix in parallel."""
         # create dictionary for the integrals
-        self._fields: dict[int, npt.NDArray[np.complex128 | np.float64]] = {}
+        self._fields = {}
 
         # initialise real and imaginary matrices
         D_r = np.zeros((self.L**2, self.L**2))
@@ -113,6 +358,17 @@ class SlepianArbitrary(SlepianFunctions):
         D_r_ext, shm_r_ext = sleplet._parallel_methods.create_shared_memory_array(D_r)
         D_i_ext, shm_i_ext = sleplet._parallel_methods.create_shared_memory_array(D_i)
 
+        # each index only fills its own column so resume from completed columns
+        checkpoint_directory = self._find_checkpoint_directory()
+        completed = np.zeros(self.L**2, dtype=np.bool_)
+        for checkpoint in sleplet._checkpoint_methods.load_all_checkpoints(
+            checkpoint_directory,
+            "columns",
+        ):
+            D_r_ext[:, checkpoint["columns"]] = checkpoint["D"].real
+            D_i_ext[:, checkpoint["columns"]] = checkpoint["D"].imag
+            completed[checkpoint["columns"]] = True
+
         def func(chunk: list[int]) -> None:
             """Calculate D matrix components for each chunk."""
             (
@@ -124,27 +380,35 @@ class SlepianArbitrary(SlepianFunctions):
                 shm_i_int,
             ) = sleplet._parallel_methods.attach_to_shared_memory_block(D_i, shm_i_ext)
 
-            for i in chunk:
-                msg = f"start ell: {i}"
-                _logger.info(msg)
-                self._matrix_helper(D_r_int, D_i_int, i)
-                msg = f"finish ell: {i}"
-                _logger.info(msg)
+            for start in range(0, len(chunk), _CHECKPOINT_COLUMNS):
+                columns = chunk[start : start + _CHECKPOINT_COLUMNS]
+                for i in columns:
+                    msg = f"start ell: {i}"
+                    _logger.info(msg)
+                    self._matrix_helper(D_r_int, D_i_int, i)
+                    msg = f"finish ell: {i}"
+                    _logger.info(msg)
+                sleplet._checkpoint_methods.save_checkpoint(
+                    checkpoint_directory,
+                    f"columns{columns[0]}",
+                    columns=np.array(columns),
+                    D=D_r_int[:, columns] + 1j * D_i_int[:, columns],
+                )
 
             sleplet._parallel_methods.free_shared_memory(shm_r_int, shm_i_int)
 
         # split up L range to maximise efficiency
-        ncpu = int(os.getenv("NCPU", "4"))
-        msg = f"Number of CPU={ncpu}"
-        _logger.info(msg)
-        chunks = sleplet._parallel_methods.split_arr_into_chunks(
-            self.L**2,
-            ncpu,
-        )
+        ncpu = sleplet._parallel_methods.get_ncpu()
+        chunks = [
+            chunk[~completed[chunk]]
+            for chunk in sleplet._parallel_methods.split_arr_into_chunks(
+                self.L**2,
+                ncpu,
+            )
+        ]
 
-        # initialise pool and apply function
-        with concurrent.futures.ThreadPoolExecutor(max_workers=ncpu) as e:
-            e.map(func, chunks)
+        # apply function to each chunk with the chosen backend
+        sleplet._parallel_methods.run_chunks_in_parallel(func, chunks, ncpu)
 
         # retrieve from parallel function
         D = D_r_ext + 1j * D_i_ext
@@ -152,6 +416,9 @@ class SlepianArbitrary(SlepianFunctions):
         # Free and release the shared memory block at the very end
         sleplet._parallel_methods.free_shared_memory(shm_r_ext, shm_i_ext)
         sleplet._parallel_methods.release_shared_memory(shm_r_ext, shm_i_ext)
+
+        if self.symmetric:
+            sleplet._slepian_arbitrary_methods.fill_matrix_using_conjugate_symmetry(D)
         return D
 
     def _matrix_helper(
@@ -166,6 +433,10 @@ class SlepianArbitrary(SlepianFunctions):
         The hack with splitting into real and imaginary parts
         is not required for the serial case but here for ease
         """
+        if self.symmetric:
+            self._matrix_helper_symmetric(D_r, D_i, i)
+            return
+
         # fill in diagonal components
         integral = self._integral(i, i)
         D_r[i][i] = integral.real
@@ -189,6 +460,20 @@ class SlepianArbitrary(SlepianFunctions):
                 D_r[j][i] = integral.real
                 D_i[j][i] = integral.imag
 
+    def _matrix_helper_symmetric(
+        self: typing_extensions.Self,
+        D_r: npt.NDArray[np.float64],
+        D_i: npt.NDArray[np.float64],
+        i: int,
+    ) -> None:
+        """Only compute the elements in the rows with `m >= 0`."""
+        for j in range(i, D_r.shape[0]):
+            _, m_j = ssht.ind2elm(j)
+            if m_j >= 0:
+                integral = self._integral(j, i)
+                D_r[j][i] = integral.real
+                D_i[j][i] = integral.imag
+
     def _integral(self: typing_extensions.Self, i: int, j: int) -> complex:
         """Calculate the D integral between two spherical harmonics."""
         if i not in self._fields:
@@ -203,9 +488,65 @@ class SlepianArbitrary(SlepianFunctions):
                 self.L,
                 self._resolution,
             )
-        return sleplet._integration_methods.integrate_region_sphere(
-            self.mask,
-            self._weight,
+        return sleplet._integration_methods.integrate_compressed_region(
+            self._region_indices,
+            self._region_weights,
             self._fields[i],
             self._fields[j].conj(),
         )
+
+    @pydantic.field_validator("assembly")
+    def _check_assembly(
+        cls,
+        v: str,
+    ) -> str:
+        if v not in {"integral", "product"}:
+            msg = "assembly should be one of 'integral' or 'product'"
+            raise ValueError(msg)
+        return v
+
+    @pydantic.field_validator("resolution")
+    def _check_resolution(
+        cls,
+        v: int | None,
+        info: pydantic.ValidationInfo,
+    ) -> int | None:
+        if v is not None and v < info.data["L"]:
+            msg = f"resolution should be at least L={info.data['L']}"
+            raise ValueError(msg)
+        return v
+
+    @pydantic.field_validator("incremental")
+    def _check_incremental(
+        cls,
+        v: bool,  # noqa: FBT001
+        info: pydantic.ValidationInfo,
+    ) -> bool:
+        if v and (
+            info.data.get("resolution") is None
+            or info.data.get("assembly") != "product"
+        ):
+            msg = "incremental requires a resolution and the 'product' assembly"
+            raise ValueError(msg)
+        return v
+
+    @pydantic.field_validator("max_memory")
+    def _check_max_memory(
+        cls,
+        v: int | str | None,
+    ) -> int | str | None:
+        if v is not None and sleplet._string_methods.convert_memory_to_bytes(v) <= 0:
+            msg = "max_memory should be positive"
+            raise ValueError(msg)
+        return v
+
+
+def _split_into_tiles(
+    harmonics: npt.NDArray[np.int_],
+    tile_size: int,
+) -> list[npt.NDArray[np.int_]]:
+    """Split the harmonics into blocks of the given size."""
+    return [
+        harmonics[start : start + tile_size]
+        for start in range(0, len(harmonics), tile_size)
+    ]
@@ -7,8 +7,10 @@ import logging
 import numpy as np
 import numpy.typing as npt
 import pydantic
+import scipy.sparse.linalg as LA_sparse  # noqa: N812
 import typing_extensions
 
+import sleplet._eigensolver_methods
 import sleplet._validation
 from sleplet.slepian.region import Region
 
@@ -21,6 +23,17 @@ class SlepianFunctions:
 
     L: int
     """The spherical harmonic bandlimit."""
+    eigensolver: str = dataclasses.field(default="dense", kw_only=True, repr=False)
+    """
+    How the eigenproblem is solved. By default (i.e. `dense`) the full spectrum
+    is computed. If `partial` then only the largest `N + L` eigenvalues, and
+    their eigenvectors, are computed which is much faster for small regions.
+    If `iterative` then these are found with Lanczos iterations, where the
+    arbitrary and limited latitude longitude regions apply the matrix-free
+    concentration operator rather than forming the Slepian matrix. The polar
+    cap and full longitude regions are solved one order at a time, in which
+    case the largest `N + L` eigenpairs over all the orders are kept unless
+    the eigensolver is `dense`."""
     eigenvalues: npt.NDArray[np.float64] = dataclasses.field(
         default_factory=lambda: np.empty(0),
         kw_only=True,
@@ -59,10 +72,36 @@ class SlepianFunctions:
         msg = f"Shannon number N={self.N}"
         _logger.info(msg)
         self.matrix_location = self._create_matrix_location()
+        if self.eigensolver != "dense":
+            self.matrix_location += f"_{self.eigensolver}"
         _logger.info("start solving eigenproblem")
         self.eigenvalues, self.eigenvectors = self._solve_eigenproblem()
         _logger.info("finished solving eigenproblem")
 
+    def _solve_hermitian_eigenproblem(
+        self: typing_extensions.Self,
+        matrix: npt.NDArray[np.complex128 | np.float64] | LA_sparse.LinearOperator,
+    ) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.complex128 | np.float64]]:
+        """Solve the eigenproblem of the Slepian matrix with the chosen eigensolver."""
+        return sleplet._eigensolver_methods.solve_hermitian_eigenproblem(
+            matrix,
+            self.eigensolver,
+            self.N + self.L,
+        )
+
+    def _count_eigenpairs_over_orders(
+        self: typing_extensions.Self,
+        n_eigenpairs: int,
+    ) -> int:
+        """
+        Find how many of the eigenpairs found one order at a time are kept,
+        which matches the number found by the chosen eigensolver for the whole
+        Slepian matrix.
+        """
+        if self.eigensolver == "dense":
+            return n_eigenpairs
+        return min(self.N + self.L, n_eigenpairs)
+
     @abc.abstractmethod
     def _create_fn_name(self: typing_extensions.Self) -> str:
         """Create the name for plotting."""
@@ -94,3 +133,13 @@ class SlepianFunctions:
     ) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.complex128]]:
         """Solve the eigenproblem for the given function."""
         raise NotImplementedError
+
+    @pydantic.field_validator("eigensolver")
+    def _check_eigensolver(
+        cls,
+        v: str,
+    ) -> str:
+        if v not in {"dense", "iterative", "partial"}:
+            msg = "eigensolver should be one of 'dense', 'iterative' or 'partial'"
+            raise ValueError(msg)
+        return v
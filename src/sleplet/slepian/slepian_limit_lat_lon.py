@@ -1,11 +1,13 @@
 """Contains the `SlepianLimitLatLon` class."""
 
+import typing
+
 import numba
 import numpy as np
-import numpy.linalg as LA  # noqa: N812
 import numpy.typing as npt
 import platformdirs
 import pydantic
+import scipy.sparse.linalg as LA_sparse  # noqa: N812
 import typing_extensions
 
 import pyssht as ssht
@@ -13,9 +15,13 @@ import pyssht as ssht
 import sleplet._array_methods
 import sleplet._data.setup_pooch
 import sleplet._mask_methods
+import sleplet._operator_methods
+import sleplet._parallel_methods
+import sleplet._slepian_lat_lon_methods
 import sleplet._validation
 import sleplet._vars
 import sleplet.slepian.region
+from sleplet.slepian._banded_eigenvectors import BandedEigenvectors
 from sleplet.slepian.slepian_functions import SlepianFunctions
 
 
@@ -31,6 +37,14 @@ class SlepianLimitLatLon(SlepianFunctions):
     r"""Maximum \(\theta\) value."""
     theta_min: float = sleplet._vars.THETA_MIN_DEFAULT
     r"""Minimum \(\theta\) value."""
+    assembly: typing.Literal["loop", "product"] = "product"
+    """
+    How the Slepian matrix is assembled. By default (i.e. `product`) the
+    sub-integral matrix is split into its separate integrals over phi and
+    theta, so the sums over the orders are contracted with the products of
+    the Wigner-d functions as matrix products. If `loop` then every element is
+    summed over the orders in a compiled loop, with the (l, p) blocks split
+    between the threads so that their costs are balanced."""
 
     def __post_init__(self: typing_extensions.Self) -> None:
         super().__post_init__()
@@ -72,22 +86,80 @@ class SlepianLimitLatLon(SlepianFunctions):
                 sleplet._data.setup_pooch.find_on_pooch_then_local(evec_loc),
             )
         except TypeError:
-            K = self._create_K_matrix()
-            eigenvalues, eigenvectors = self._clean_evals_and_evecs(LA.eigh(K))
+            if np.isclose(self.phi_max - self.phi_min, 2 * np.pi):
+                eigenvalues, eigenvectors_banded = self._solve_eigenproblem_orders()
+                eigenvectors = eigenvectors_banded[:]
+            else:
+                if self.eigensolver == "iterative":
+                    # the operator is the complex conjugate of the K matrix
+                    eigenvalues, evecs = self._solve_hermitian_eigenproblem(
+                        self._create_concentration_operator(),
+                    )
+                    evecs = evecs.conj()
+                else:
+                    eigenvalues, evecs = self._solve_hermitian_eigenproblem(
+                        self._create_K_matrix(),
+                    )
+                eigenvalues, eigenvectors = self._clean_evals_and_evecs(
+                    (eigenvalues, evecs.astype(np.complex128, copy=False)),
+                )
             np.save(platformdirs.user_data_path() / eval_loc, eigenvalues)
             np.save(platformdirs.user_data_path() / evec_loc, eigenvectors[: self.N])
         return eigenvalues, eigenvectors
 
+    def _create_concentration_operator(
+        self: typing_extensions.Self,
+    ) -> LA_sparse.LinearOperator:
+        """Create the concentration operator which is integrated exactly."""
+        resolution = sleplet._operator_methods.choose_operator_resolution(
+            self.L,
+            self.region,
+        )
+        return sleplet._operator_methods.create_concentration_operator(
+            self.L,
+            resolution,
+            sleplet._operator_methods.create_region_weight(
+                self.L,
+                resolution,
+                self.region,
+            ),
+        )
+
     def _create_K_matrix(  # noqa: N802
         self: typing_extensions.Self,
     ) -> npt.NDArray[np.complex128]:
         """Compute the K matrix."""
-        # Compute sub-integral matrix
-        G = self._slepian_integral()
-
-        # Compute Slepian matrix
         dl_array = ssht.generate_dl(np.pi / 2, self.L)
-        K = self._slepian_matrix(dl_array, self.L, self.L - 1, G)
+        if self.assembly == "product":
+            K = self._slepian_matrix_product(
+                dl_array,
+                sleplet._slepian_lat_lon_methods.calc_phi_integrals(
+                    self.L,
+                    self.phi_min,
+                    self.phi_max,
+                ),
+                sleplet._slepian_lat_lon_methods.calc_theta_integrals(
+                    self.L,
+                    self.theta_min,
+                    self.theta_max,
+                ),
+            )
+        else:
+            # Compute sub-integral matrix
+            G = self._slepian_integral()
+
+            # Compute Slepian matrix with the threads limited to NCPU
+            ncpu = min(
+                sleplet._parallel_methods.get_ncpu(),
+                numba.config.NUMBA_NUM_THREADS,  # type: ignore[attr-defined]
+            )
+            units, offsets = self._create_work_units(self.L, ncpu)
+            previous_ncpu = numba.get_num_threads()
+            numba.set_num_threads(ncpu)
+            try:
+                K = self._slepian_matrix(dl_array, G, units, offsets)
+            finally:
+                numba.set_num_threads(previous_ncpu)
         sleplet._array_methods.fill_upper_triangle_of_hermitian_matrix(K)
 
         return K
@@ -107,62 +179,153 @@ class SlepianLimitLatLon(SlepianFunctions):
         for all orders using the formulation given in "Slepian spatialspectral
         concentration problem on the sphere: Analytical formulation for limited
         colatitude-longitude spatial region" by A. P. Bates, Z. Khalid and R. A.
-        Kennedy.
+        Kennedy. The matrix is evaluated in closed form over all the rows and
+        columns at once, and is cached for each region and bandlimit.
         """
-        G = np.zeros((4 * self.L - 3, 4 * self.L - 3), dtype=np.complex128)
-
-        def helper(row: int, col: int, S: float) -> None:
-            """Use conjugate symmetry property to reduce the number of iterations."""
-            try:
-                Q = (1 / (col**2 - 1)) * (
-                    np.exp(1j * col * self.theta_min)
-                    * (1j * col * np.sin(self.theta_min) - np.cos(self.theta_min))
-                    + np.exp(1j * col * self.theta_max)
-                    * (np.cos(self.theta_max) - 1j * col * np.sin(self.theta_max))
-                )
-            except ZeroDivisionError:
-                Q = 0.25 * (
-                    2 * 1j * col * (self.theta_max - self.theta_min)
-                    + np.exp(2 * 1j * col * self.theta_min)
-                    - np.exp(2 * 1j * col * self.theta_max)
-                )
+        return sleplet._slepian_lat_lon_methods.create_sub_integral_matrix(
+            self.L,
+            (self.theta_min, self.theta_max),
+            (self.phi_min, self.phi_max),
+        )
 
-            G[2 * (self.L - 1) + row, 2 * (self.L - 1) + col] = Q * S
-            G[2 * (self.L - 1) - row, 2 * (self.L - 1) - col] = G[
-                2 * (self.L - 1) + row,
-                2 * (self.L - 1) + col,
-            ].conj()
-
-        # for row equal to zero
-        S = self.phi_max - self.phi_min
-        for col in range(-2 * (self.L - 1), 1):
-            helper(0, col, S)
-
-        # for row not equal to zero
-        for row in range(-2 * (self.L - 1), 0):
-            S = (1j / row) * (
-                np.exp(1j * row * self.phi_min) - np.exp(1j * row * self.phi_max)
+    @staticmethod
+    def _slepian_matrix_product(
+        dl: npt.NDArray[np.float64],
+        S: npt.NDArray[np.complex128],
+        Q: npt.NDArray[np.complex128],
+    ) -> npt.NDArray[np.complex128]:
+        """
+        Compute the lower triangle of the Slepian matrix with matrix products.
+        The sub-integral matrix is the outer product G = S Q^T of the integrals
+        over phi and theta, so K_lm,pq = C1 (-i)^(m-q) S_(m-q) sum_m' A_l(m',m)
+        sum_q' Q_(m'-q') A_p(q',q) with A_l(m',m) = dl(m',m) dl(m',0). The sum
+        over q' is a single product with the Toeplitz matrix of Q for all p and
+        q, after which each degree l of the rows is a product with the columns
+        p <= l.
+        """
+        L = len(dl)
+        N = L - 1
+        ell, emm, A, QA = SlepianLimitLatLon._contract_wigner_products(dl, Q)
+        phase = (-1j) ** np.arange(-2 * N, 2 * N + 1) * S
+        K = np.zeros((L**2, L**2), dtype=np.complex128)
+        for el in range(L):
+            rows = slice(el**2, (el + 1) ** 2)
+            cols = slice((el + 1) ** 2)
+            C1 = np.sqrt((2 * el + 1) * (2 * ell[cols] + 1)) / (4 * np.pi)
+            K[rows, cols] = (
+                (A[rows] @ QA[:, cols])
+                * C1
+                * phase[2 * N + np.subtract.outer(emm[rows], emm[cols])]
             )
-            for col in range(-2 * (self.L - 1), 2 * (self.L - 1) + 1):
-                helper(row, col, S)
+        return K
+
+    @staticmethod
+    def _contract_wigner_products(
+        dl: npt.NDArray[np.float64],
+        Q: npt.NDArray[np.complex128],
+    ) -> tuple[
+        npt.NDArray[np.int_],
+        npt.NDArray[np.int_],
+        npt.NDArray[np.float64],
+        npt.NDArray[np.complex128],
+    ]:
+        """
+        Compute the products of the Wigner-d functions A_l(m',m) for all the
+        (l,m) rows and m' columns, and their sum over q' with the Toeplitz
+        matrix of the theta integrals Q_(m'-q') for every (p,q), along with the
+        degree and order of each row.
+        """
+        L = len(dl)
+        N = L - 1
+        index = np.arange(L**2)
+        ell = np.sqrt(index).astype(int)
+        emm = index - ell * (ell + 1)
+        A = (dl * dl[:, :, N, np.newaxis]).transpose(0, 2, 1)[ell, N + emm]
+        order = np.arange(-N, N + 1)
+        QA = Q[2 * N + np.subtract.outer(order, order)] @ A.T
+        return ell, emm, A, QA
+
+    def _solve_eigenproblem_orders(
+        self: typing_extensions.Self,
+    ) -> tuple[npt.NDArray[np.float64], BandedEigenvectors]:
+        """
+        Solve the eigenproblem of a region spanning all longitudes one order at
+        a time. The integrals over phi then vanish unless m = q, so K is block
+        diagonal in the order and each block of the degrees l >= |m| is solved
+        separately with the chosen eigensolver, which is O(L^4) rather than
+        O(L^6). As for the polar cap, only the largest `N + L` eigenpairs over
+        all the orders are kept unless the `dense` eigensolver is chosen. The
+        eigenvectors only keep the band of degrees of their order and are sorted
+        in descending order of eigenvalues.
+        """
+        ell, emm, A, QA = self._contract_wigner_products(
+            ssht.generate_dl(np.pi / 2, self.L),
+            sleplet._slepian_lat_lon_methods.calc_theta_integrals(
+                self.L,
+                self.theta_min,
+                self.theta_max,
+            ),
+        )
+        eigenvalues, bands, orders = [], [], []
+        for m in range(-(self.L - 1), self.L):
+            idx = np.flatnonzero(emm == m)
+            C1 = np.sqrt(np.outer(2 * ell[idx] + 1, 2 * ell[idx] + 1)) / (4 * np.pi)
+            Km = (self.phi_max - self.phi_min) * C1 * (A[idx] @ QA[:, idx])
+            evals, evecs = self._solve_hermitian_eigenproblem(Km)
+            band = np.zeros((len(evals), self.L), dtype=np.complex128)
+            band[:, abs(m) :] = evecs.conj().T
+            if m == 0:
+                # ensure first element of each eigenvector is positive
+                band *= np.where(band[:, 0] < 0, -1, 1)[:, np.newaxis]
+            eigenvalues.append(evals.real)
+            bands.append(band)
+            orders.append(np.full(len(evals), m))
+        eigenvalues_all = np.concatenate(eigenvalues)
+        n_eigenpairs = self._count_eigenpairs_over_orders(len(eigenvalues_all))
+        idx = eigenvalues_all.argsort()[::-1][:n_eigenpairs]
+        return eigenvalues_all[idx], BandedEigenvectors(
+            self.L,
+            np.concatenate(bands)[idx],
+            np.concatenate(orders)[idx],
+        )
 
-        return G
+    @staticmethod
+    def _create_work_units(
+        L: int,
+        ncpu: int,
+    ) -> tuple[npt.NDArray[np.int_], npt.NDArray[np.int_]]:
+        """
+        Split the (l, p) blocks of the lower triangle of the Slepian matrix
+        between the threads. The cost of a block grows as (2l+1)^2 (2p+1)^2, so
+        splitting over l alone leaves the threads with the highest degrees to
+        do most of the work. The blocks are returned ordered by thread, along
+        with the offsets of the blocks of each thread. This scheduling is only
+        used by the `loop` assembly.
+        """
+        ell, p = np.tril_indices(L)
+        costs = ((2 * ell + 1) * (2 * p + 1)) ** 2.0
+        chunks = sleplet._parallel_methods.split_costs_into_chunks(costs, ncpu)
+        order = np.concatenate(chunks)
+        offsets = np.cumsum([0] + [len(chunk) for chunk in chunks])
+        return np.column_stack([ell[order], p[order]]), offsets
 
     @staticmethod
     @numba.njit(parallel=True, fastmath=True)
     def _slepian_matrix(
         dl: npt.NDArray[np.float64],
-        L: int,
-        N: int,
         G: npt.NDArray[np.complex128],
+        units: npt.NDArray[np.int_],
+        offsets: npt.NDArray[np.int_],
     ) -> npt.NDArray[np.complex128]:
         """
         Syntax:
-        K = _slepian_matrix(dl, L, N, G).
+        K = _slepian_matrix(dl, G, units, offsets).
 
         Input:
         G  =  Sub-integral matrix (obtained after the use of Wigner-D and
         Wigner-d functions in computing the Slepian integral) for all orders
+        units  =  (l, p) blocks of the lower triangle ordered by thread
+        offsets  =  start of the blocks of each thread
 
         Output:
         K  =  Slepian matrix
@@ -173,10 +336,14 @@ class SlepianLimitLatLon(SlepianFunctions):
         Analytical formulation for limited colatitude-longitude spatial region"
         by A. P. Bates, Z. Khalid and R. A. Kennedy.
         """
+        L = len(dl)
+        N = L - 1
         K = np.zeros((L**2, L**2), dtype=np.complex128)
 
-        for ell in numba.prange(L):
-            for p in range(ell + 1):
+        for thread in numba.prange(len(offsets) - 1):
+            for unit in range(offsets[thread], offsets[thread + 1]):
+                ell = units[unit, 0]
+                p = units[unit, 1]
                 C1 = np.sqrt((2 * ell + 1) * (2 * p + 1)) / (4 * np.pi)
 
                 for m in range(-ell, ell + 1):
@@ -205,9 +372,7 @@ class SlepianLimitLatLon(SlepianFunctions):
 
     @staticmethod
     def _clean_evals_and_evecs(
-        eigendecomposition: tuple[
-            npt.NDArray[np.complex128], npt.NDArray[np.complex128]
-        ],
+        eigendecomposition: tuple[npt.NDArray[np.float64], npt.NDArray[np.complex128]],
     ) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.complex128]]:
         """Need eigenvalues and eigenvectors to be in a certain format."""
         # access values
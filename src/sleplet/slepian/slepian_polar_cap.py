@@ -1,26 +1,30 @@
 """Contains the `SlepianPolarCap` class."""
 
-import concurrent.futures
 import dataclasses
 import logging
-import os
+import pathlib
+import typing
 
-import gmpy2 as gp
+import numba
 import numpy as np
-import numpy.linalg as LA  # noqa: N812
 import numpy.typing as npt
 import platformdirs
 import pydantic
+import scipy.linalg
 import typing_extensions
 
 import pyssht as ssht
 
+import sleplet._checkpoint_methods
 import sleplet._data.setup_pooch
+import sleplet._integration_methods
 import sleplet._mask_methods
 import sleplet._parallel_methods
 import sleplet._validation
+import sleplet._wigner_methods
 import sleplet.harmonic_methods
 import sleplet.slepian.region
+from sleplet.slepian._banded_eigenvectors import BandedEigenvectors
 from sleplet.slepian.slepian_functions import SlepianFunctions
 
 _logger = logging.getLogger(__name__)
@@ -43,6 +47,24 @@ class SlepianPolarCap(SlepianFunctions):
     `order` is specified by an integer then only a given order `m` will be
     computed. In the Slepian eigenproblem formulation this simplifies the
     mathematical formulation."""
+    method: typing.Literal["tridiagonal", "wigner"] = "wigner"
+    """
+    How the eigenvectors of each order are found. By default (i.e. `wigner`)
+    the Dm matrix is built from sums of Wigner 3j symbols and diagonalised. If
+    `tridiagonal` then the eigenvectors are those of the tridiagonal matrix of
+    Grünbaum et al. which commutes with Dm, and their concentrations are found
+    as Rayleigh quotients by Gauss-Legendre quadrature over the cap, so Dm is
+    never built. This is only available for a single polar cap."""
+    eigenvectors_banded: BandedEigenvectors | None = dataclasses.field(
+        default=None,
+        init=False,
+        repr=False,
+    )
+    """
+    The eigenvectors holding only the band of degrees l = 0, ..., L-1 of their
+    order, which is how they are held and saved. The `eigenvectors` are the
+    expansion of these to the full harmonic coefficients, which for `L > 16`
+    is only made for the first `N` of them."""
 
     def __post_init__(self: typing_extensions.Self) -> None:
         super().__post_init__()
@@ -60,15 +82,16 @@ class SlepianPolarCap(SlepianFunctions):
         return 2 * np.pi * (1 - np.cos(self.theta_max))
 
     def _create_matrix_location(self: typing_extensions.Self) -> str:
-        return (
+        location = (
             f"slepian_eigensolutions_D_{self.region._name_ending}_L{self.L}_N{self.N}"
         )
+        return location if self.method == "wigner" else f"{location}_{self.method}"
 
     def _solve_eigenproblem(
         self: typing_extensions.Self,
     ) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.complex128]]:
         eval_loc = f"{self.matrix_location}_eigenvalues.npy"
-        evec_loc = f"{self.matrix_location}_eigenvectors.npy"
+        evec_loc = f"{self.matrix_location}_eigenvectors_banded.npy"
         order_loc = f"{self.matrix_location}_orders.npy"
         try:
             eigenvalues, eigenvectors = self._solve_eigenproblem_from_files(
@@ -82,26 +105,41 @@ class SlepianPolarCap(SlepianFunctions):
                 evec_loc,
                 order_loc,
             )
-        return eigenvalues, eigenvectors
+        self.eigenvectors_banded = eigenvectors
+        limit = self.N if self.L > _L_SAVE_ALL else None
+        return eigenvalues, eigenvectors[:limit]
 
     def _solve_eigenproblem_from_files(
         self: typing_extensions.Self,
         eval_loc: str,
         evec_loc: str,
         order_loc: str,
-    ) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.complex128]]:
-        """Solve eigenproblem with files already saved."""
+    ) -> tuple[npt.NDArray[np.float64], BandedEigenvectors]:
+        """
+        Solve eigenproblem with files already saved, the eigenvectors may also
+        be read from the full harmonic coefficients of earlier versions.
+        """
         eigenvalues = np.load(
             sleplet._data.setup_pooch.find_on_pooch_then_local(eval_loc),
         )
-        eigenvectors = np.load(
-            sleplet._data.setup_pooch.find_on_pooch_then_local(evec_loc),
-        )
         orders = np.load(sleplet._data.setup_pooch.find_on_pooch_then_local(order_loc))
+        bands_loc = sleplet._data.setup_pooch.find_on_pooch_then_local(evec_loc)
+        if bands_loc is None:
+            eigenvectors = BandedEigenvectors.from_dense(
+                np.load(
+                    sleplet._data.setup_pooch.find_on_pooch_then_local(
+                        f"{self.matrix_location}_eigenvectors.npy",
+                    ),
+                ),
+                orders,
+            )
+        else:
+            bands = np.load(bands_loc)
+            eigenvectors = BandedEigenvectors(self.L, bands, orders[: len(bands)])
 
         if self.order is not None:
-            idx = np.where(orders == self.order)
-            return eigenvalues[idx], eigenvectors[idx]
+            idx = orders == self.order
+            return eigenvalues[idx], eigenvectors.select(idx[: len(eigenvectors)])
         self.order = orders
         return eigenvalues, eigenvectors
 
@@ -110,40 +148,207 @@ class SlepianPolarCap(SlepianFunctions):
         eval_loc: str,
         evec_loc: str,
         order_loc: str,
-    ) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.complex128]]:
+    ) -> tuple[npt.NDArray[np.float64], BandedEigenvectors]:
         """Solve eigenproblem from scratch and then saves the files."""
         if isinstance(self.order, int):
-            return self._solve_eigenproblem_order(self.order)
+            eigenvalues, gl = self._solve_eigenproblem_order(abs(self.order))
+            eigenvalues, bands = self._clean_evals_and_evecs(
+                eigenvalues,
+                gl,
+                self.order,
+            )
+            return eigenvalues, BandedEigenvectors(
+                self.L,
+                bands,
+                np.full(len(bands), self.order),
+            )
 
-        evals_all = np.empty(0)
-        evecs_all = np.empty((0, self.L**2), dtype=np.complex128)
-        emm = np.empty(0, dtype=int)
+        self._solve_all_orders()
+        eigenpairs = [self._solve_eigenproblem_order(m) for m in range(self.L)]
+        evals_all, evecs_all, emm_all = [], [], []
         for m in range(-(self.L - 1), self.L):
-            evals_m, evecs_m = self._solve_eigenproblem_order(m)
-            evals_all = np.append(evals_all, evals_m)  # type: ignore[assignment]
-            evecs_all = np.concatenate((evecs_all, evecs_m))
-            emm = np.concatenate((emm, np.full(len(evals_m), m)))
+            evals_m, evecs_m = self._clean_evals_and_evecs(*eigenpairs[abs(m)], m)
+            evals_all.append(evals_m)
+            evecs_all.append(evecs_m)
+            emm_all.append(np.full(len(evals_m), m))
         (
             eigenvalues,
-            eigenvectors,
+            bands,
             self.order,
-        ) = self._sort_all_evals_and_evecs(evals_all, evecs_all, emm)
+        ) = self._sort_all_evals_and_evecs(
+            np.concatenate(evals_all),
+            np.concatenate(evecs_all),
+            np.concatenate(emm_all),
+        )
+        n_eigenpairs = self._count_eigenpairs_over_orders(len(eigenvalues))
+        eigenvalues = eigenvalues[:n_eigenpairs]
+        bands = bands[:n_eigenpairs]
+        self.order = self.order[:n_eigenpairs]
         limit = self.N if self.L > _L_SAVE_ALL else None
         np.save(platformdirs.user_data_path() / eval_loc, eigenvalues)
-        np.save(platformdirs.user_data_path() / evec_loc, eigenvectors[:limit])
+        np.save(platformdirs.user_data_path() / evec_loc, bands[:limit])
         np.save(platformdirs.user_data_path() / order_loc, self.order)
-        return eigenvalues, eigenvectors
+        sleplet._checkpoint_methods.remove_checkpoint_directory(
+            self._find_orders_directory(),
+        )
+        return eigenvalues, BandedEigenvectors(self.L, bands, self.order)
+
+    def _solve_all_orders(self: typing_extensions.Self) -> None:
+        """
+        Solve the eigenproblem of every order |m| with the chosen backend, where
+        each order builds its Dm matrix serially and caches its eigenpairs.
+        """
+
+        def func(chunk: list[int]) -> None:
+            """Solve the eigenproblem of each order in the chunk."""
+            for m in chunk:
+                self._solve_eigenproblem_order(int(m), backend="serial")
+
+        # split up the orders to balance the sizes of the Dm matrices
+        ncpu = sleplet._parallel_methods.get_ncpu()
+        chunks = sleplet._parallel_methods.split_arr_into_chunks(self.L, ncpu)
+
+        # apply function to each chunk with the chosen backend
+        sleplet._parallel_methods.run_chunks_in_parallel(func, chunks, ncpu)
 
     def _solve_eigenproblem_order(
         self: typing_extensions.Self,
         m: int,
-    ) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.complex128]]:
-        """Solve the eigenproblem for a given order m."""
-        emm = sleplet.harmonic_methods._create_emm_vector(self.L)
-        Dm = self._create_Dm_matrix(abs(m), emm)
-        eigenvalues, gl = LA.eigh(Dm)
-        eigenvalues, eigenvectors = self._clean_evals_and_evecs(eigenvalues, gl, emm, m)
-        return eigenvalues, eigenvectors
+        *,
+        backend: str | None = None,
+    ) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.complex128 | np.float64]]:
+        """
+        Solve the eigenproblem of the Dm matrix for the order |m|, which is
+        shared by m and -m. The eigenpairs of each order are cached so that an
+        interrupted run resumes from the completed orders, and a single order
+        of an existing region is only computed once. The cache is removed once
+        the eigenpairs of all the orders have been saved.
+        """
+        directory = self._find_orders_directory()
+        eigenpair = sleplet._checkpoint_methods.load_checkpoint(directory, f"order{m}")
+        if eigenpair is not None:
+            return (
+                eigenpair["eigenvalues"].astype(np.float64, copy=False),
+                eigenpair["eigenvectors"].astype(np.float64, copy=False),
+            )
+        gl: npt.NDArray[np.complex128 | np.float64]
+        if self.method == "tridiagonal":
+            eigenvalues, gl = self._solve_commuting_eigenproblem(m)
+        else:
+            emm = sleplet.harmonic_methods._create_emm_vector(self.L)
+            Dm = self._create_Dm_matrix(m, emm, backend=backend)
+            eigenvalues, gl = (
+                self._solve_parity_eigenproblems(Dm)
+                if self.gap
+                else self._solve_hermitian_eigenproblem(Dm)
+            )
+        sleplet._checkpoint_methods.save_checkpoint(
+            directory,
+            f"order{m}",
+            eigenvalues=eigenvalues,
+            eigenvectors=gl,
+        )
+        return eigenvalues, gl
+
+    def _solve_parity_eigenproblems(
+        self: typing_extensions.Self,
+        Dm: npt.NDArray[np.float64],
+    ) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+        """
+        Solve the eigenproblems of the even and odd parity blocks of the polar
+        gap Dm matrix separately, as the elements coupling the degrees l and p
+        with l + p odd vanish. The eigenvectors of each block are zero in the
+        degrees of the other parity.
+        """
+        eigenvalues, gl = [], []
+        for parity in range(min(2, len(Dm))):
+            evals, evecs = self._solve_hermitian_eigenproblem(
+                Dm[parity::2, parity::2],
+            )
+            vectors = np.zeros((len(Dm), evecs.shape[1]))
+            vectors[parity::2] = evecs
+            eigenvalues.append(evals)
+            gl.append(vectors)
+        return np.concatenate(eigenvalues), np.concatenate(gl, axis=1)
+
+    def _solve_commuting_eigenproblem(
+        self: typing_extensions.Self,
+        m: int,
+    ) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+        """
+        Solve the eigenproblem of the order |m| with the tridiagonal matrix
+        which commutes with Dm (Grünbaum et al. 1982, Simons et al. 2006), so
+        shares its eigenvectors. The eigenvalues of the tridiagonal matrix
+        increase as the concentration decreases, so only the lowest are found
+        unless the `dense` eigensolver is chosen. The concentrations are then
+        the Rayleigh quotients g^T Dm g, where Dm = 2pi int X_lm X_pm dcos(theta)
+        over the cap is integrated exactly by L Gauss-Legendre nodes.
+        """
+        el = np.arange(m, self.L)
+        cos_theta_max = np.cos(self.theta_max)
+        diagonal = -el * (el + 1) * cos_theta_max
+        ell = el[:-1]
+        off_diagonal = (ell * (ell + 2) - (self.L - 1) * (self.L + 1)) * np.sqrt(
+            ((ell + 1) ** 2 - m**2) / ((2 * ell + 1) * (2 * ell + 3)),
+        )
+        n_eigenpairs = (
+            len(el) if self.eigensolver == "dense" else min(self.N + self.L, len(el))
+        )
+        _, gl = scipy.linalg.eigh_tridiagonal(
+            diagonal,
+            off_diagonal,
+            select="i",
+            select_range=(0, n_eigenpairs - 1),
+            lapack_driver="stemr",
+        )
+
+        nodes, weights = sleplet._integration_methods.calc_polar_cap_quadrature(
+            self.L,
+            self.theta_max,
+        )
+        Xm = self._create_legendre_matrix(m, self.L, nodes)
+        eigenvalues = weights @ (Xm.T @ gl) ** 2
+        return eigenvalues, gl
+
+    @staticmethod
+    @numba.njit(cache=True, nogil=True)
+    def _create_legendre_matrix(
+        m: int,
+        L: int,
+        x: npt.NDArray[np.float64],
+    ) -> npt.NDArray[np.float64]:
+        """
+        Compute the orthonormal associated Legendre functions X_lm(x) for
+        l = m, ..., L-1 by the recursion in l. The recursion is started from
+        the logarithm of X_mm and rescaled as it grows, so that the functions
+        of high order near the poles are found without underflow.
+        """
+        rescale = sleplet._wigner_methods._RESCALE
+        Xm = np.zeros((L - m, len(x)))
+        log_mm = 0.5 * np.log((2 * m + 1) / (4 * np.pi))
+        for k in range(1, m + 1):
+            log_mm += 0.5 * np.log((2 * k - 1) / (2 * k))
+        for q in range(len(x)):
+            log_scale = log_mm + 0.5 * m * np.log(1 - x[q] ** 2)
+            previous, current = 0.0, 1.0
+            Xm[0, q] = np.exp(log_scale)
+            for i in range(1, L - m):
+                el = m + i
+                a = np.sqrt((4 * el**2 - 1) / (el**2 - m**2))
+                b = np.sqrt(((el - 1) ** 2 - m**2) / (4 * (el - 1) ** 2 - 1))
+                previous, current = current, a * (x[q] * current - b * previous)
+                if abs(current) > rescale:
+                    previous /= rescale
+                    current /= rescale
+                    log_scale += np.log(rescale)
+                Xm[i, q] = current * np.exp(log_scale)
+        return Xm
+
+    def _find_orders_directory(self: typing_extensions.Self) -> pathlib.Path:
+        """Find the folder holding the cached eigenpairs of each order."""
+        return (
+            platformdirs.user_data_path() / f"{self.matrix_location}_order_eigenpairs"
+        )
 
     def _sort_all_evals_and_evecs(
         self: typing_extensions.Self,
@@ -153,7 +358,7 @@ class SlepianPolarCap(SlepianFunctions):
     ) -> tuple[
         npt.NDArray[np.float64], npt.NDArray[np.complex128], npt.NDArray[np.int_]
     ]:
-        """Sort all eigenvalues and eigenvectors for all orders."""
+        """Sort all eigenvalues and eigenvectors (or their bands) for all orders."""
         idx = eigenvalues.argsort()[::-1]
         eigenvalues = eigenvalues[idx]
         eigenvectors = eigenvectors[idx]
@@ -164,6 +369,8 @@ class SlepianPolarCap(SlepianFunctions):
         self: typing_extensions.Self,
         m: int,
         emm: npt.NDArray[np.float64],
+        *,
+        backend: str | None = None,
     ) -> npt.NDArray[np.float64]:
         """
         Syntax:
@@ -182,9 +389,9 @@ class SlepianPolarCap(SlepianFunctions):
         degrees, using the formulation given in "Spatiospectral Concentration on
         a Sphere" by F.J. Simons, F.A. Dahlen and M.A. Wieczorek.
         """
-        Pl, ell = self._create_legendre_polynomials_table(emm)
+        Pl = self._create_legendre_polynomials_table(emm)
+        wigner_0 = sleplet._wigner_methods.wigner3j_zero_order_table(self.L)
         Dm = np.zeros((self.L - m, self.L - m))
-        lvec = np.arange(m, self.L)
 
         Dm_ext, shm_ext = sleplet._parallel_methods.create_shared_memory_array(Dm)
 
@@ -199,24 +406,26 @@ class SlepianPolarCap(SlepianFunctions):
             for i in chunk:
                 msg = f"start ell: {i}"
                 _logger.info(msg)
-                self._dm_matrix_helper(Dm_int, i, m, lvec, Pl, ell)
+                self._dm_matrix_row(Dm_int, i, m, Pl, wigner_0, self.gap)
                 msg = f"finish ell: {i}"
                 _logger.info(msg)
 
             sleplet._parallel_methods.free_shared_memory(shm_int)
 
         # split up L range to maximise efficiency
-        ncpu = int(os.getenv("NCPU", "4"))
-        msg = f"Number of CPU={ncpu}"
-        _logger.info(msg)
+        ncpu = sleplet._parallel_methods.get_ncpu()
         chunks = sleplet._parallel_methods.split_arr_into_chunks(
             self.L - m,
             ncpu,
         )
 
-        # initialise pool and apply function
-        with concurrent.futures.ThreadPoolExecutor(max_workers=ncpu) as e:
-            e.map(func, chunks)
+        # apply function to each chunk with the chosen backend
+        sleplet._parallel_methods.run_chunks_in_parallel(
+            func,
+            chunks,
+            ncpu,
+            backend=backend,
+        )
 
         # retrieve from parallel function
         Dm = Dm_ext * (-1) ** m / 2
@@ -229,173 +438,71 @@ class SlepianPolarCap(SlepianFunctions):
     def _create_legendre_polynomials_table(
         self: typing_extensions.Self,
         emm: npt.NDArray[np.float64],
-    ) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.int_]]:
+    ) -> npt.NDArray[np.float64]:
         """Create Legendre polynomials table for matrix calculation."""
         Plm = ssht.create_ylm(self.theta_max, 0, 2 * self.L).real.reshape(-1)
         ind = emm == 0
-        ell = np.arange(2 * self.L)[np.newaxis]
-        Pl = np.sqrt((4 * np.pi) / (2 * ell + 1)) * Plm[ind]
-        return Pl, ell
+        ell = np.arange(2 * self.L)
+        return np.sqrt((4 * np.pi) / (2 * ell + 1)) * Plm[ind]
 
-    def _dm_matrix_helper(  # noqa: PLR0913
-        self: typing_extensions.Self,
+    @staticmethod
+    @numba.njit(cache=True, nogil=True)
+    def _dm_matrix_row(  # noqa: PLR0913, PLR0917
         Dm: npt.NDArray[np.float64],
         i: int,
         m: int,
-        lvec: npt.NDArray[np.int_],
         Pl: npt.NDArray[np.float64],
-        ell: npt.NDArray[np.int_],
+        wigner_0: npt.NDArray[np.float64],
+        gap: bool,  # noqa: FBT001
     ) -> None:
-        """Use in both serial and parallel calculations."""
-        el = int(lvec[i])
-        for j in range(i, self.L - m):
-            p = int(lvec[j])
-            c = 0
-            for n in range(abs(el - p), el + p + 1):
-                A = Pl[ell == n - 1] if n != 0 else 1
-                c += (
-                    self._wigner3j(el, n, p, 0, 0, 0)
-                    * self._wigner3j(el, n, p, m, 0, -m)
-                    * (A - Pl[ell == n + 1])
-                )
-            Dm[i, j] = (
-                self._polar_gap_modification(el, p)
-                * np.sqrt((2 * el + 1) * (2 * p + 1))
-                * c
-            )
-            Dm[j, i] = Dm[i, j]
-
-    @staticmethod
-    def _wigner3j(  # noqa: PLR0913
-        l1: int,
-        l2: int,
-        l3: int,
-        m1: int,
-        m2: int,
-        m3: int,
-    ) -> float:
         """
-        Syntax:
-        s = _wigner3j (l1, l2, l3, m1, m2, m3).
-
-        Input:
-        l1  =  first degree in Wigner 3j symbol
-        l2  =  second degree in Wigner 3j symbol
-        l3  =  third degree in Wigner 3j symbol
-        m1  =  first order in Wigner 3j symbol
-        m2  =  second order in Wigner 3j symbol
-        m3  =  third order in Wigner 3j symbol
-
-        Output:
-        s  =  Wigner 3j symbol for l1,m1; l2,m2; l3,m3
-
-        Description:
-        Computes Wigner 3j symbol using Racah formula
-        """
-        if (
-            2 * l1 != np.floor(2 * l1)
-            or 2 * l2 != np.floor(2 * l2)
-            or 2 * l3 != np.floor(2 * l3)
-            or 2 * m1 != np.floor(2 * m1)
-            or 2 * m2 != np.floor(2 * m2)
-            or 2 * m3 != np.floor(2 * m3)
-        ):
-            msg = "Arguments must either be integer or half-integer!"
-            raise ValueError(msg)
-
-        if (
-            m1 + m2 + m3 != 0
-            or l3 < abs(l1 - l2)
-            or l3 > (l1 + l2)
-            or abs(m1) > abs(l1)
-            or abs(m2) > abs(l2)
-            or abs(m3) > abs(l3)
-            or l1 + l2 + l3 != np.floor(l1 + l2 + l3)
-        ):
-            s = 0
-        else:
-            t1 = l2 - l3 - m1
-            t2 = l1 - l3 + m2
-            t3 = l1 + l2 - l3
-            t4 = l1 - m1
-            t5 = l2 + m2
-
-            tmin = max(0, t1, t2)
-            tmax = min(t3, t4, t5)
-
-            # sum is over all those t for which the
-            # following factorials have non-zero arguments
-            s = sum(
-                (-1) ** t
-                / (
-                    gp.factorial(t)
-                    * gp.factorial(t - t1)
-                    * gp.factorial(t - t2)
-                    * gp.factorial(t3 - t)
-                    * gp.factorial(t4 - t)
-                    * gp.factorial(t5 - t)
-                )
-                for t in range(tmin, tmax + 1)
-            )
-            triangle_coefficient = (
-                gp.factorial(t3)
-                * gp.factorial(l1 - l2 + l3)
-                * gp.factorial(-l1 + l2 + l3)
-                / gp.factorial(l1 + l2 + l3 + 1)
-            )
-
-            s *= (
-                np.float_power(-1, l1 - l2 - m3)
-                * gp.sqrt(triangle_coefficient)
-                * gp.sqrt(
-                    gp.factorial(l1 + m1)
-                    * gp.factorial(t4)
-                    * gp.factorial(t5)
-                    * gp.factorial(l2 - m2)
-                    * gp.factorial(l3 + m3)
-                    * gp.factorial(l3 - m3),
-                )
-            )
-        return s
-
-    def _polar_gap_modification(
-        self: typing_extensions.Self,
-        ell1: int,
-        ell2: int,
-    ) -> int:
+        Compute the row i of the Dm matrix for degree l = m + i, in both the
+        serial and parallel calculations. The sum over n uses whole rows of the
+        Wigner 3j symbols with the columns permuted to (l p n; 0 0 0) and
+        (l p n; m -m 0) whose signs cancel in the product, where only the terms
+        with l + p + n even are non-zero. The former are shared between the
+        orders so are read from the table. For the polar gap the elements with
+        l + p odd vanish, so only every other column is computed.
         """
-        Eq 67 - Spherical Slepian functions and the polar gap in geodesy
-        multiply by 1 + (-1)*(ell+ell').
-        """
-        return 1 + self.gap * (-1) ** (ell1 + ell2)
+        el = m + i
+        for j in range(i, len(Dm), 1 + gap):
+            p = m + j
+            n_min, wigner_m = sleplet._wigner_methods._wigner3j_recursion(el, p, m, -m)
+            c = 0.0
+            for k in range(0, len(wigner_m), 2):
+                n = n_min + k
+                A = Pl[n - 1] if n != 0 else 1.0
+                c += wigner_0[el, p, k // 2] * wigner_m[k] * (A - Pl[n + 1])
+            Dm[i, j] = (1 + gap) * np.sqrt((2 * el + 1) * (2 * p + 1)) * c
+            Dm[j, i] = Dm[i, j]
 
     def _clean_evals_and_evecs(
         self: typing_extensions.Self,
         eigenvalues: npt.NDArray[np.float64],
-        gl: npt.NDArray[np.float64],
-        emm: npt.NDArray[np.float64],
+        gl: npt.NDArray[np.complex128 | np.float64],
         m: int,
     ) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.complex128]]:
-        """Need eigenvalues and eigenvectors to be in a certain format."""
+        """
+        Need eigenvalues and eigenvectors to be in a certain format, where the
+        eigenvectors are the bands of degrees l = 0, ..., L-1 of the order m.
+        """
         # Sort eigenvalues and eigenvectors in descending order of eigenvalues
         idx = eigenvalues.argsort()[::-1]
         eigenvalues = eigenvalues[idx]
         gl = gl[:, idx].conj()
 
-        # put back in full D space for harmonic transform
-        emm = emm[: self.L**2]
-        ind = np.tile(emm == m, (self.L - abs(m), 1))
-        eigenvectors = np.zeros((self.L - abs(m), self.L**2), dtype=np.complex128)
-        eigenvectors[ind] = gl.T.flatten()
+        # put back in the band of degrees of the order for harmonic transform
+        bands = np.zeros((gl.shape[1], self.L), dtype=np.complex128)
+        bands[:, abs(m) :] = gl.T
 
         # ensure first element of each eigenvector is positive
-        eigenvectors *= np.where(eigenvectors[:, 0] < 0, -1, 1)[:, np.newaxis]
+        bands *= np.where(bands[:, 0] < 0, -1, 1)[:, np.newaxis]
 
         # if -ve 'm' find orthogonal eigenvectors to +ve 'm' eigenvectors
         if m < 0:
-            eigenvectors *= 1j
+            bands *= 1j
 
-        return eigenvalues, eigenvectors
+        return eigenvalues, bands
 
     @pydantic.field_validator("order")
     def _check_order(
@@ -408,6 +515,17 @@ class SlepianPolarCap(SlepianFunctions):
             raise ValueError(msg)
         return v
 
+    @pydantic.field_validator("method")
+    def _check_method(
+        cls,
+        v: typing.Literal["tridiagonal", "wigner"],
+        info: pydantic.ValidationInfo,
+    ) -> typing.Literal["tridiagonal", "wigner"]:
+        if v == "tridiagonal" and info.data["gap"]:
+            msg = "the 'tridiagonal' method is only available without a gap"
+            raise ValueError(msg)
+        return v
+
     @pydantic.field_validator("theta_max")
     def _check_theta_max(
         cls,
@@ -4,9 +4,11 @@ import logging
 
 import numpy as np
 import numpy.typing as npt
+import scipy.sparse.linalg as LA_sparse  # noqa: N812
 
 import pyssht as ssht
 
+import sleplet._operator_methods
 import sleplet._vars
 import sleplet.harmonic_methods
 import sleplet.meshes._mesh_slepian_decomposition
@@ -69,6 +71,43 @@ def choose_slepian_method(
             raise ValueError(msg)
 
 
+def concentration_operator(
+    L: int,
+    region: Region,
+    *,
+    resolution: int | None = None,
+) -> LA_sparse.LinearOperator:
+    """
+    Create a matrix-free view of the Slepian concentration operator.
+
+    Applying the operator performs an inverse spherical harmonic transform, a
+    multiplication by the weighted region and the adjoint transform, so the
+    memory scales with the number of samples rather than with the size of the
+    Slepian matrix. The polar cap and limited latitude longitude regions are
+    integrated exactly whereas arbitrary regions use their pixelised mask.
+
+    Args:
+        L: The spherical harmonic bandlimit.
+        region: The Slepian region.
+        resolution: The resolution of the samples used to integrate over the
+            region, by default `2L` for arbitrary regions (i.e. the resolution
+            of the masks) and `4L` otherwise.
+
+    Returns:
+        The Hermitian concentration operator on the harmonic coefficients.
+    """
+    resolution = (
+        sleplet._operator_methods.choose_operator_resolution(L, region)
+        if resolution is None
+        else resolution
+    )
+    return sleplet._operator_methods.create_concentration_operator(
+        L,
+        resolution,
+        sleplet._operator_methods.create_region_weight(L, resolution, region),
+    )
+
+
 def slepian_inverse(
     f_p: npt.NDArray[np.complex128 | np.float64],
     L: int,
@@ -175,19 +214,22 @@ def slepian_mesh_forward(
     u_i: npt.NDArray[np.complex128 | np.float64] | None = None,
     mask: bool = False,
     n_coeffs: int | None = None,
-) -> npt.NDArray[np.float64]:
+) -> npt.NDArray[np.complex128 | np.float64]:
     """
     Compute the Slepian forward transform for all coefficients on the mesh.
 
     Args:
         mesh_slepian: The Slepian mesh object containing the eigensolutions.
-        u: The signal field value on the mesh.
-        u_i: The Fourier coefficients of the mesh.
+        u: The signal field value on the mesh, or a stack of signals with one
+            per row.
+        u_i: The Fourier coefficients of the mesh, or a stack of coefficients
+            with one per row.
         mask: Whether to use the mask to compute the coefficients.
         n_coeffs: The number of Slepian coefficients to use.
 
     Returns:
-        The Slepian coefficients on the mesh.
+        The Slepian coefficients on the mesh, with one row per signal if a
+        stack is given.
     """
     sd = sleplet.meshes._mesh_slepian_decomposition.MeshSlepianDecomposition(
         mesh_slepian,
@@ -213,19 +255,4 @@ def slepian_mesh_inverse(
     Returns:
         The value of a function on the mesh in pixel space.
     """
-    f_p_reshape = f_p[: mesh_slepian.N, np.newaxis]
-    s_p = _compute_mesh_s_p_pixel(mesh_slepian)
-    return (f_p_reshape * s_p).sum(axis=0)
-
-
-def _compute_mesh_s_p_pixel(
-    mesh_slepian: "sleplet.meshes.mesh_slepian.MeshSlepian",
-) -> npt.NDArray[np.float64]:
-    """Calculate Sp(omega) for a given region."""
-    sp = np.zeros((mesh_slepian.N, mesh_slepian.mesh.vertices.shape[0]))
-    for p in range(mesh_slepian.N):
-        sp[p] = sleplet.harmonic_methods.mesh_inverse(
-            mesh_slepian.mesh,
-            mesh_slepian.slepian_functions[p],
-        )
-    return sp
+    return f_p[: mesh_slepian.N] @ mesh_slepian.slepian_functions_pixel
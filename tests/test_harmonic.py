@@ -24,3 +24,47 @@ def test_invert_flm_and_boost(random_flm: npt.NDArray[np.complex128]) -> None:
     n_theta, n_phi = ssht.sample_shape(L_LARGE, Method=sleplet._vars.SAMPLING_SCHEME)
     f = sleplet.harmonic_methods.invert_flm_boosted(random_flm, L_SMALL, L_LARGE)
     np.testing.assert_equal(f.shape, (n_theta, n_phi))
+
+
+def test_exact_integration_weight_orthonormal_harmonics() -> None:
+    """Test that the exact weights integrate products of harmonics exactly."""
+    resolution = 2 * L_SMALL - 2
+    weight = sleplet._integration_methods.calc_exact_integration_weight(resolution)
+    ylm = np.array(
+        [
+            sleplet.harmonic_methods.invert_flm_boosted(
+                sleplet.harmonic_methods._create_spherical_harmonic(L_SMALL, i),
+                L_SMALL,
+                resolution,
+            ).reshape(-1)
+            for i in range(L_SMALL**2)
+        ],
+    )
+    np.testing.assert_allclose(
+        (ylm * weight.reshape(-1)) @ ylm.conj().T,
+        np.eye(L_SMALL**2),
+        atol=1e-13,
+    )
+
+
+def test_compressed_region_matches_masked_integral(
+    slepian_polar_cap: sleplet.slepian.SlepianPolarCap,
+    random_flm: npt.NDArray[np.complex128],
+) -> None:
+    """Test that integrating the compressed region matches the masked sphere."""
+    f = ssht.inverse(random_flm, L_SMALL, Method=sleplet._vars.SAMPLING_SCHEME)
+    weight = sleplet._integration_methods.calc_integration_weight(L_SMALL)
+    indices, weights = sleplet._integration_methods.compress_region(
+        slepian_polar_cap.mask,
+        weight,
+    )
+    np.testing.assert_equal(len(indices), slepian_polar_cap.mask.sum())
+    np.testing.assert_allclose(
+        sleplet._integration_methods.integrate_compressed_region(
+            indices,
+            weights,
+            f,
+            f.conj(),
+        ),
+        (f * f.conj() * weight * slepian_polar_cap.mask).sum(),
+    )
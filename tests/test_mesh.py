@@ -1,4 +1,5 @@
 import numpy as np
+import pytest
 
 import sleplet
 
@@ -22,6 +23,27 @@ def test_inverse_forward_transform_recovery(
     )
 
 
+def test_mesh_transforms_of_a_stack_match_each_signal(
+    mesh_field_region: sleplet.meshes.mesh_field.MeshField,
+) -> None:
+    """
+    Tests that transforming a stack of signals in one call matches
+    transforming each of the signals separately.
+    """
+    coefficients = np.outer(np.arange(1, 4), mesh_field_region.coefficients)
+    fields = sleplet.harmonic_methods.mesh_inverse(mesh_field_region.mesh, coefficients)
+    recovered = sleplet.harmonic_methods.mesh_forward(mesh_field_region.mesh, fields)
+    for coefficient, field, recov in zip(coefficients, fields, recovered, strict=True):
+        np.testing.assert_allclose(
+            field,
+            sleplet.harmonic_methods.mesh_inverse(mesh_field_region.mesh, coefficient),
+        )
+        np.testing.assert_allclose(
+            recov,
+            sleplet.harmonic_methods.mesh_forward(mesh_field_region.mesh, field),
+        )
+
+
 def test_orthonormality_over_mesh_full(mesh: sleplet.meshes.mesh.Mesh) -> None:
     """
     For the computation of the Slepian D matrix the basis
@@ -44,3 +66,65 @@ def test_orthonormality_over_mesh_full(mesh: sleplet.meshes.mesh.Mesh) -> None:
         0,
         atol=1e-16,
     )
+
+
+def test_mesh_eigensolvers_find_the_same_eigenvalues(
+    mesh: sleplet.meshes.mesh.Mesh,
+) -> None:
+    """
+    Tests that each of the mesh eigensolvers finds the same smallest
+    eigenvalues of the Laplacian, and that the eigenvectors are orthonormal.
+    """
+    number_basis_functions = 40
+    eigenvalues = {}
+    for eigensolver in ("shift_invert", "lobpcg", "slicing"):
+        (
+            eigenvalues[eigensolver],
+            eigenvectors,
+        ) = sleplet._mesh_methods.solve_laplacian_eigenproblem(
+            mesh.name,
+            mesh.vertices,
+            mesh.faces,
+            number_basis_functions,
+            eigensolver,
+        )
+        np.testing.assert_allclose(
+            eigenvectors.T @ eigenvectors,
+            np.identity(number_basis_functions),
+            atol=1e-8,
+        )
+    np.testing.assert_allclose(
+        eigenvalues["lobpcg"],
+        eigenvalues["shift_invert"],
+        atol=1e-10,
+    )
+    np.testing.assert_allclose(
+        eigenvalues["slicing"],
+        eigenvalues["shift_invert"],
+        atol=1e-10,
+    )
+
+
+def test_mesh_laplacian_factorised_once_per_shift(
+    monkeypatch: pytest.MonkeyPatch,
+    mesh: sleplet.meshes.mesh.Mesh,
+) -> None:
+    """Tests that solving a mesh again reuses the cached factorisation."""
+    monkeypatch.setattr(sleplet._mesh_methods, "_factorisations", {})
+    splu = sleplet._mesh_methods.LA_sparse.splu
+    calls = []
+
+    def counted_splu(*args: object, **kwargs: object) -> object:
+        calls.append(args)
+        return splu(*args, **kwargs)
+
+    monkeypatch.setattr(sleplet._mesh_methods.LA_sparse, "splu", counted_splu)
+    for number_basis_functions in (20, 40):
+        sleplet._mesh_methods.solve_laplacian_eigenproblem(
+            mesh.name,
+            mesh.vertices,
+            mesh.faces,
+            number_basis_functions,
+            "shift_invert",
+        )
+    assert len(calls) == 1
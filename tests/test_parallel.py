@@ -1,4 +1,5 @@
 import numpy as np
+import pytest
 
 import sleplet
 
@@ -15,3 +16,19 @@ def test_split_L_into_chunks(  # noqa: N802
     chunk_length = L_SMALL // NCPU
     for chunk in chunks:
         np.testing.assert_allclose(len(chunk), chunk_length, atol=0)
+
+
+def test_split_costs_into_balanced_chunks() -> None:
+    """Ensure work units of growing cost are split into chunks of equal cost."""
+    costs = np.arange(1, L_LARGE + 1) ** 4.0
+    chunks = sleplet._parallel_methods.split_costs_into_chunks(costs, NCPU)
+    np.testing.assert_equal(np.sort(np.concatenate(chunks)), np.arange(L_LARGE))
+    chunk_costs = [costs[chunk].sum() for chunk in chunks]
+    np.testing.assert_allclose(chunk_costs, costs.sum() / NCPU, rtol=1e-2)
+
+
+def test_invalid_parallel_backend_raises(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Ensure an unknown execution backend is rejected."""
+    monkeypatch.setenv("PARALLEL_BACKEND", "gpu")
+    with pytest.raises(ValueError, match="PARALLEL_BACKEND must be one of"):
+        sleplet._parallel_methods.get_backend()
@@ -0,0 +1,499 @@
+import pathlib
+
+import numba
+import numpy as np
+import numpy.typing as npt
+import platformdirs
+import pytest
+
+import sleplet
+
+L = 16
+MASK = "south_america"
+ORDER = 2
+
+
+def test_arbitrary_product_matches_integral_assembly(
+    slepian_arbitrary: sleplet.slepian.SlepianArbitrary,
+) -> None:
+    """Test that the matrix product D matrix matches the element-wise integrals."""
+    D_integral = slepian_arbitrary._create_D_matrix_integral()
+    sleplet._array_methods.fill_upper_triangle_of_hermitian_matrix(D_integral)
+    D_product = slepian_arbitrary._create_D_matrix_product()
+    sleplet._array_methods.fill_upper_triangle_of_hermitian_matrix(D_product)
+    np.testing.assert_allclose(D_product, D_integral, atol=1e-14)
+
+
+def test_arbitrary_tiled_matches_single_block_assembly(
+    slepian_arbitrary: sleplet.slepian.SlepianArbitrary,
+) -> None:
+    """Test that building the D matrix in blocks gives the same matrix."""
+    slepian_tiled = sleplet.slepian.SlepianArbitrary(L, MASK, max_memory="256KB")
+    D_tiled = slepian_tiled._create_D_matrix_product()
+    assert slepian_tiled._calculate_tile_size(slepian_tiled.mask.sum(), L**2) < L**2
+    sleplet._array_methods.fill_upper_triangle_of_hermitian_matrix(D_tiled)
+    D_product = slepian_arbitrary._create_D_matrix_product()
+    sleplet._array_methods.fill_upper_triangle_of_hermitian_matrix(D_product)
+    np.testing.assert_allclose(D_tiled, D_product, atol=1e-14)
+
+
+def test_arbitrary_conjugate_symmetry_matches_full_assembly(
+    slepian_arbitrary: sleplet.slepian.SlepianArbitrary,
+) -> None:
+    """Test that the m -> -m symmetry reproduces the fully computed D matrix."""
+    slepian_full = sleplet.slepian.SlepianArbitrary(L, MASK, symmetric=False)
+    D_full = slepian_full._create_D_matrix_product()
+    sleplet._array_methods.fill_upper_triangle_of_hermitian_matrix(D_full)
+    D_product = slepian_arbitrary._create_D_matrix_product()
+    sleplet._array_methods.fill_upper_triangle_of_hermitian_matrix(D_product)
+    np.testing.assert_allclose(D_product, D_full, atol=1e-14)
+    D_integral = slepian_arbitrary._create_D_matrix_integral()
+    sleplet._array_methods.fill_upper_triangle_of_hermitian_matrix(D_integral)
+    np.testing.assert_allclose(D_integral, D_full, atol=1e-14)
+
+
+@pytest.mark.parametrize("backend", ["threads", "processes"])
+def test_polar_cap_parallel_backends_match_serial(
+    monkeypatch: pytest.MonkeyPatch,
+    slepian_polar_cap: sleplet.slepian.SlepianPolarCap,
+    backend: str,
+) -> None:
+    """Test that every execution backend gives the serial Dm matrix."""
+    emm = sleplet.harmonic_methods._create_emm_vector(slepian_polar_cap.L)
+    monkeypatch.setenv("PARALLEL_BACKEND", "serial")
+    Dm_serial = slepian_polar_cap._create_Dm_matrix(ORDER, emm)
+    monkeypatch.setenv("PARALLEL_BACKEND", backend)
+    np.testing.assert_allclose(
+        slepian_polar_cap._create_Dm_matrix(ORDER, emm),
+        Dm_serial,
+        atol=1e-14,
+    )
+
+
+def test_partial_eigensolver_matches_dense(
+    slepian_arbitrary: sleplet.slepian.SlepianArbitrary,
+) -> None:
+    """Test that the partial eigensolver finds the leading eigenpairs."""
+    slepian_partial = sleplet.slepian.SlepianArbitrary(
+        L,
+        MASK,
+        eigensolver="partial",
+    )
+    N = slepian_arbitrary.N
+    np.testing.assert_equal(len(slepian_partial.eigenvalues), N + L)
+    np.testing.assert_allclose(
+        slepian_partial.eigenvalues[:N],
+        slepian_arbitrary.eigenvalues[:N],
+        atol=1e-14,
+    )
+    np.testing.assert_allclose(
+        np.abs(
+            (
+                slepian_partial.eigenvectors[:N]
+                * slepian_arbitrary.eigenvectors[:N].conj()
+            ).sum(axis=1),
+        ),
+        1,
+    )
+
+
+def test_concentration_operator_matches_arbitrary_D_matrix(  # noqa: N802
+    slepian_arbitrary: sleplet.slepian.SlepianArbitrary,
+) -> None:
+    """Test that the matrix-free operator applies the conjugate D matrix."""
+    D = slepian_arbitrary._create_D_matrix()
+    sleplet._array_methods.fill_upper_triangle_of_hermitian_matrix(D)
+    operator = sleplet.slepian_methods.concentration_operator(
+        L,
+        slepian_arbitrary.region,
+    )
+    np.testing.assert_allclose(operator @ np.eye(L**2), D.conj(), atol=1e-14)
+
+
+def test_iterative_eigensolver_matches_dense(
+    slepian_arbitrary: sleplet.slepian.SlepianArbitrary,
+) -> None:
+    """Test that the operator based eigensolver finds the leading eigenpairs."""
+    slepian_iterative = sleplet.slepian.SlepianArbitrary(
+        L,
+        MASK,
+        eigensolver="iterative",
+    )
+    N = slepian_arbitrary.N
+    np.testing.assert_allclose(
+        slepian_iterative.eigenvalues[:N],
+        slepian_arbitrary.eigenvalues[:N],
+        atol=1e-12,
+    )
+    np.testing.assert_allclose(
+        np.abs(
+            (
+                slepian_iterative.eigenvectors[:N]
+                * slepian_arbitrary.eigenvectors[:N].conj()
+            ).sum(axis=1),
+        ),
+        1,
+    )
+
+
+def test_concentration_operator_matches_lim_lat_lon_K_matrix(  # noqa: N802
+    slepian_lim_lat_lon: sleplet.slepian.SlepianLimitLatLon,
+) -> None:
+    """Test that the operator integrates the limited region exactly."""
+    K = slepian_lim_lat_lon._create_K_matrix()
+    operator = sleplet.slepian_methods.concentration_operator(
+        L,
+        slepian_lim_lat_lon.region,
+    )
+    np.testing.assert_allclose(operator @ np.eye(L**2), K.conj(), atol=1e-14)
+
+
+def test_arbitrary_resumes_from_checkpoint(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that an interrupted D matrix build resumes from the saved blocks."""
+    slepian_tiled = sleplet.slepian.SlepianArbitrary(L, MASK, max_memory="256KB")
+    checkpoint_directory = slepian_tiled._find_checkpoint_directory()
+    sleplet._checkpoint_methods.remove_checkpoint_directory(checkpoint_directory)
+
+    sampled = []
+    n_samples_before_kill = None
+    sample_harmonics = sleplet.slepian.SlepianArbitrary._sample_harmonics
+
+    def counting_sample_harmonics(
+        self: sleplet.slepian.SlepianArbitrary,
+        indices: npt.NDArray[np.int_],
+    ) -> npt.NDArray[np.complex128]:
+        if len(sampled) == n_samples_before_kill:
+            msg = "killed"
+            raise RuntimeError(msg)
+        sampled.append(len(indices))
+        return sample_harmonics(self, indices)
+
+    monkeypatch.setattr(
+        sleplet.slepian.SlepianArbitrary,
+        "_sample_harmonics",
+        counting_sample_harmonics,
+    )
+    D_full = slepian_tiled._create_D_matrix_product()
+    n_sampled_full = sum(sampled)
+    assert not checkpoint_directory.exists()
+
+    # simulate the job being killed before the final block was saved
+    n_samples_before_kill = len(sampled) - 1
+    sampled.clear()
+    with pytest.raises(RuntimeError, match="killed"):
+        slepian_tiled._create_D_matrix_product()
+    assert checkpoint_directory.exists()
+    n_samples_before_kill = None
+    sampled.clear()
+    D_resumed = slepian_tiled._create_D_matrix_product()
+    assert not checkpoint_directory.exists()
+
+    assert 0 < sum(sampled) < n_sampled_full
+    np.testing.assert_allclose(D_resumed, D_full, atol=0)
+
+
+def test_arbitrary_single_block_not_checkpointed(
+    monkeypatch: pytest.MonkeyPatch,
+    slepian_arbitrary: sleplet.slepian.SlepianArbitrary,
+) -> None:
+    """Test that a D matrix built in a single block saves no checkpoints."""
+    saved = []
+    monkeypatch.setattr(
+        sleplet._checkpoint_methods,
+        "save_checkpoint",
+        lambda _directory, name, **_: saved.append(name),
+    )
+    slepian_arbitrary._create_D_matrix_product()
+    assert not saved
+    assert not slepian_arbitrary._find_checkpoint_directory().exists()
+
+
+def test_arbitrary_exact_weights_bound_eigenvalues() -> None:
+    """Test that the exact weights keep the concentrations between 0 and 1."""
+    slepian_exact = sleplet.slepian.SlepianArbitrary(L, MASK, resolution=2 * L)
+    assert slepian_exact.matrix_location.endswith(f"_res{2 * L}")
+    np.testing.assert_array_less(slepian_exact.eigenvalues, 1 + 1e-14)
+    np.testing.assert_array_less(-1e-14, slepian_exact.eigenvalues)
+
+
+def test_arbitrary_incremental_extends_lower_bandlimit(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: pathlib.Path,
+) -> None:
+    """Test that extending a cached lower bandlimit D matrix is exact."""
+    monkeypatch.setattr(platformdirs, "user_data_path", lambda: tmp_path)
+    resolution = 2 * L
+    sleplet.slepian.SlepianArbitrary(
+        L // 2,
+        MASK,
+        resolution=resolution,
+        incremental=True,
+    )
+    slepian_incremental = sleplet.slepian.SlepianArbitrary(
+        L,
+        MASK,
+        resolution=resolution,
+        incremental=True,
+    )
+    # remove the cached matrix at L so the one at L/2 is extended
+    (tmp_path / f"{slepian_incremental._create_matrix_location()}_D.npy").unlink()
+    np.testing.assert_equal(
+        slepian_incremental._load_previous_D_matrix().shape,
+        ((L // 2) ** 2, (L // 2) ** 2),
+    )
+    D_incremental = slepian_incremental._create_D_matrix()
+    sleplet._array_methods.fill_upper_triangle_of_hermitian_matrix(D_incremental)
+    D_full = slepian_incremental._create_D_matrix_product()
+    sleplet._array_methods.fill_upper_triangle_of_hermitian_matrix(D_full)
+    np.testing.assert_allclose(D_incremental, D_full, atol=1e-14)
+
+
+def test_wigner3j_tables_orthonormal() -> None:
+    """Test that the recursive Wigner 3j symbols are orthonormal over l3."""
+    l1, l2 = L - 1, L // 2
+    l3_min, wigner_a = sleplet._wigner_methods._wigner3j_recursion(
+        l1,
+        l2,
+        ORDER,
+        -ORDER,
+    )
+    _, wigner_b = sleplet._wigner_methods._wigner3j_recursion(
+        l1,
+        l2,
+        ORDER + 1,
+        -ORDER - 1,
+    )
+    l3 = np.arange(l3_min, l1 + l2 + 1)
+    np.testing.assert_allclose(((2 * l3 + 1) * wigner_a**2).sum(), 1)
+    np.testing.assert_allclose(
+        ((2 * l3 + 1) * wigner_a * wigner_b).sum(),
+        0,
+        atol=1e-14,
+    )
+    np.testing.assert_allclose(
+        sleplet._wigner_methods._wigner3j_recursion(l1, l1, ORDER, -ORDER)[1][0],
+        (-1) ** (l1 - ORDER) / np.sqrt(2 * l1 + 1),
+    )
+    np.testing.assert_allclose(
+        sleplet._wigner_methods.wigner3j_zero_order_table(L)[l1, l2],
+        np.pad(
+            sleplet._wigner_methods._wigner3j_recursion(l1, l2, 0, 0)[1][::2],
+            (0, L - l2 - 1),
+        ),
+    )
+
+
+def test_polar_gap_Dm_matrix_doubles_even_parity(  # noqa: N802
+    monkeypatch: pytest.MonkeyPatch,
+    slepian_polar_cap: sleplet.slepian.SlepianPolarCap,
+) -> None:
+    """Test that the polar gap doubles the even and removes the odd parity."""
+    emm = sleplet.harmonic_methods._create_emm_vector(slepian_polar_cap.L)
+    Dm_cap = slepian_polar_cap._create_Dm_matrix(ORDER, emm)
+    monkeypatch.setattr(slepian_polar_cap, "gap", True)
+    Dm_gap = slepian_polar_cap._create_Dm_matrix(ORDER, emm)
+    ell = np.arange(ORDER, slepian_polar_cap.L)
+    parity = (ell[:, np.newaxis] + ell[np.newaxis]) % 2
+    np.testing.assert_allclose(Dm_gap, np.where(parity, 0, 2 * Dm_cap), atol=1e-14)
+
+
+def test_polar_cap_order_eigenpairs_match_all_orders(
+    slepian_polar_cap: sleplet.slepian.SlepianPolarCap,
+) -> None:
+    """Test that the cached eigenpairs of an order match the full solution."""
+    eigenvalues, _ = slepian_polar_cap._solve_eigenproblem_order(ORDER)
+    assert (slepian_polar_cap._find_orders_directory() / f"order{ORDER}.npz").exists()
+    np.testing.assert_allclose(
+        np.sort(eigenvalues)[::-1],
+        slepian_polar_cap.eigenvalues[slepian_polar_cap.order == ORDER],
+        atol=1e-14,
+    )
+    sleplet._checkpoint_methods.remove_checkpoint_directory(
+        slepian_polar_cap._find_orders_directory(),
+    )
+
+
+def test_polar_cap_order_eigenpairs_removed_after_full_solve(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: pathlib.Path,
+    slepian_polar_cap: sleplet.slepian.SlepianPolarCap,
+) -> None:
+    """Test that the cached eigenpairs of each order are removed once saved."""
+    monkeypatch.setattr(platformdirs, "user_data_path", lambda: tmp_path)
+    slepian = sleplet.slepian.SlepianPolarCap(L, slepian_polar_cap.theta_max / 2)
+    slepian._solve_eigenproblem_from_scratch(
+        "eigenvalues.npy",
+        "eigenvectors_banded.npy",
+        "orders.npy",
+    )
+    assert (tmp_path / "eigenvalues.npy").exists()
+    assert not slepian._find_orders_directory().exists()
+
+
+def test_polar_cap_partial_keeps_largest_eigenpairs_over_orders(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: pathlib.Path,
+    slepian_polar_cap: sleplet.slepian.SlepianPolarCap,
+) -> None:
+    """Test that only the largest N + L eigenpairs over the orders are kept."""
+    monkeypatch.setattr(platformdirs, "user_data_path", lambda: tmp_path)
+    slepian = sleplet.slepian.SlepianPolarCap(
+        L,
+        slepian_polar_cap.theta_max,
+        eigensolver="partial",
+    )
+    n_eigenpairs = min(slepian.N + L, len(slepian_polar_cap.eigenvalues))
+    assert len(slepian.eigenvalues) == n_eigenpairs
+    assert len(slepian.order) == n_eigenpairs
+    np.testing.assert_allclose(
+        slepian.eigenvalues[: slepian.N],
+        slepian_polar_cap.eigenvalues[: slepian.N],
+        atol=1e-14,
+    )
+
+
+def test_polar_cap_banded_eigenvectors_expand_losslessly(
+    slepian_polar_cap: sleplet.slepian.SlepianPolarCap,
+) -> None:
+    """Test that the banded eigenvectors survive a round trip through dense."""
+    eigenvectors = slepian_polar_cap.eigenvectors_banded
+    assert eigenvectors is not None
+    dense = eigenvectors[:]
+    assert dense.shape == eigenvectors.shape
+    np.testing.assert_equal(dense, slepian_polar_cap.eigenvectors)
+    np.testing.assert_equal(dense[ORDER], eigenvectors[ORDER])
+    emm = sleplet.harmonic_methods._create_emm_vector(slepian_polar_cap.L)
+    emm = emm[: slepian_polar_cap.L**2]
+    np.testing.assert_equal(dense[emm != slepian_polar_cap.order[:, np.newaxis]], 0)
+    np.testing.assert_equal(
+        sleplet.slepian._banded_eigenvectors.BandedEigenvectors.from_dense(
+            dense,
+            slepian_polar_cap.order,
+        )[:],
+        dense,
+    )
+
+
+def test_polar_cap_expands_only_shannon_eigenvectors(
+    monkeypatch: pytest.MonkeyPatch,
+    slepian_polar_cap: sleplet.slepian.SlepianPolarCap,
+) -> None:
+    """Test that only the first N eigenvectors are expanded at higher L."""
+    monkeypatch.setattr(sleplet.slepian.slepian_polar_cap, "_L_SAVE_ALL", 0)
+    slepian = sleplet.slepian.SlepianPolarCap(L, slepian_polar_cap.theta_max)
+    assert slepian.eigenvectors.shape == (slepian.N, L**2)
+    assert slepian.eigenvectors_banded is not None
+    assert len(slepian.eigenvectors_banded) == L**2
+    np.testing.assert_equal(
+        slepian.eigenvectors,
+        slepian_polar_cap.eigenvectors[: slepian.N],
+    )
+
+
+def test_polar_cap_tridiagonal_matches_Dm_eigenproblem(  # noqa: N802
+    slepian_polar_cap: sleplet.slepian.SlepianPolarCap,
+) -> None:
+    """Test that the commuting tridiagonal matrix gives the Dm eigenpairs."""
+    emm = sleplet.harmonic_methods._create_emm_vector(slepian_polar_cap.L)
+    Dm = slepian_polar_cap._create_Dm_matrix(ORDER, emm)
+    eigenvalues, gl = slepian_polar_cap._solve_commuting_eigenproblem(ORDER)
+    np.testing.assert_allclose(
+        np.sort(eigenvalues),
+        np.linalg.eigvalsh(Dm),
+        atol=1e-13,
+    )
+    np.testing.assert_allclose(Dm @ gl, gl * eigenvalues, atol=1e-13)
+
+
+def test_polar_gap_parity_eigenvectors_solve_Dm_eigenproblem(  # noqa: N802
+    monkeypatch: pytest.MonkeyPatch,
+    slepian_polar_cap: sleplet.slepian.SlepianPolarCap,
+) -> None:
+    """Test that the parity block eigenpairs are eigenpairs of the whole Dm."""
+    emm = sleplet.harmonic_methods._create_emm_vector(slepian_polar_cap.L)
+    monkeypatch.setattr(slepian_polar_cap, "gap", True)
+    Dm = slepian_polar_cap._create_Dm_matrix(ORDER, emm)
+    eigenvalues, gl = slepian_polar_cap._solve_parity_eigenproblems(Dm)
+    np.testing.assert_allclose(
+        np.sort(eigenvalues),
+        np.linalg.eigvalsh(Dm),
+        atol=1e-14,
+    )
+    np.testing.assert_allclose(Dm @ gl, gl * eigenvalues, atol=1e-14)
+    assert (gl[::2].any(axis=0) != gl[1::2].any(axis=0)).all()
+
+
+def test_lim_lat_lon_product_matches_loop_assembly(
+    monkeypatch: pytest.MonkeyPatch,
+    slepian_lim_lat_lon: sleplet.slepian.SlepianLimitLatLon,
+) -> None:
+    """Test that the factorised K matrix matches the element-wise loop."""
+    K_product = slepian_lim_lat_lon._create_K_matrix()
+    monkeypatch.setattr(slepian_lim_lat_lon, "assembly", "loop")
+    K_loop = slepian_lim_lat_lon._create_K_matrix()
+    np.testing.assert_allclose(K_product, K_loop, atol=1e-14)
+
+
+def test_lim_lat_lon_loop_assembly_restores_numba_threads(
+    monkeypatch: pytest.MonkeyPatch,
+    slepian_lim_lat_lon: sleplet.slepian.SlepianLimitLatLon,
+) -> None:
+    """Test that the loop assembly leaves the numba thread count unchanged."""
+    monkeypatch.setattr(slepian_lim_lat_lon, "assembly", "loop")
+    monkeypatch.setenv("NCPU", "1")
+    n_threads = numba.get_num_threads()
+    slepian_lim_lat_lon._create_K_matrix()
+    assert numba.get_num_threads() == n_threads
+
+
+def test_lim_lat_lon_sub_integral_matrix_matches_quadrature(
+    slepian_lim_lat_lon: sleplet.slepian.SlepianLimitLatLon,
+) -> None:
+    """Test the closed form sub-integral matrix against Gauss-Legendre quadrature."""
+    nodes, weights = np.polynomial.legendre.leggauss(4 * L)
+    theta = slepian_lim_lat_lon.theta_min + (nodes + 1) / 2 * (
+        slepian_lim_lat_lon.theta_max - slepian_lim_lat_lon.theta_min
+    )
+    phi = slepian_lim_lat_lon.phi_min + (nodes + 1) / 2 * (
+        slepian_lim_lat_lon.phi_max - slepian_lim_lat_lon.phi_min
+    )
+    index = np.arange(-2 * (L - 1), 2 * (L - 1) + 1)
+    S = (
+        np.exp(1j * np.outer(index, phi))
+        @ weights
+        * (slepian_lim_lat_lon.phi_max - slepian_lim_lat_lon.phi_min)
+        / 2
+    )
+    Q = (
+        np.exp(1j * np.outer(index, theta))
+        @ (weights * np.sin(theta))
+        * (slepian_lim_lat_lon.theta_max - slepian_lim_lat_lon.theta_min)
+        / 2
+    )
+    G = slepian_lim_lat_lon._slepian_integral()
+    assert G is slepian_lim_lat_lon._slepian_integral()
+    np.testing.assert_allclose(G, np.outer(S, Q), atol=1e-13)
+
+
+def test_lim_lat_lon_full_longitude_orders_solve_K_eigenproblem(  # noqa: N802
+    monkeypatch: pytest.MonkeyPatch,
+    slepian_lim_lat_lon: sleplet.slepian.SlepianLimitLatLon,
+) -> None:
+    """Test that the eigenpairs of each order diagonalise K of a latitude band."""
+    monkeypatch.setattr(slepian_lim_lat_lon, "phi_min", 0.0)
+    monkeypatch.setattr(slepian_lim_lat_lon, "phi_max", 2 * np.pi)
+    K = slepian_lim_lat_lon._create_K_matrix()
+    eigenvalues, eigenvectors = slepian_lim_lat_lon._solve_eigenproblem_orders()
+    assert eigenvectors.bands.shape == (L**2, L)
+    np.testing.assert_allclose(eigenvalues, np.linalg.eigvalsh(K)[::-1], atol=1e-14)
+    gl = eigenvectors[:].conj().T
+    np.testing.assert_allclose(K @ gl, gl * eigenvalues, atol=1e-14)
+
+    monkeypatch.setattr(slepian_lim_lat_lon, "eigensolver", "partial")
+    eigenvalues_partial, _ = slepian_lim_lat_lon._solve_eigenproblem_orders()
+    assert len(eigenvalues_partial) == slepian_lim_lat_lon.N + L
+    np.testing.assert_allclose(
+        eigenvalues_partial[: slepian_lim_lat_lon.N],
+        eigenvalues[: slepian_lim_lat_lon.N],
+        atol=1e-14,
+    )
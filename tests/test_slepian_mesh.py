@@ -82,3 +82,61 @@ def test_synthesis_mesh(
         0,
         atol=1e-16,
     )
+
+
+def test_mesh_product_matches_integral_assembly(
+    mesh_slepian: sleplet.meshes.mesh_slepian.MeshSlepian,
+) -> None:
+    """Test that the matrix product D matrix matches the element-wise integrals."""
+    D_integral = mesh_slepian._create_D_matrix_integral()
+    sleplet._array_methods.fill_upper_triangle_of_hermitian_matrix(D_integral)
+    D_product = mesh_slepian._create_D_matrix_product()
+    np.testing.assert_allclose(D_product, D_integral, atol=1e-14)
+
+
+def test_mesh_slepian_functions_pixel_match_inverse_transforms(
+    mesh_slepian: sleplet.meshes.mesh_slepian.MeshSlepian,
+) -> None:
+    """
+    Tests that the cached Slepian functions in pixel space match the
+    inverse transforms of each of the Slepian functions.
+    """
+    s_p = np.array(
+        [
+            sleplet.harmonic_methods.mesh_inverse(mesh_slepian.mesh, s_p_i)
+            for s_p_i in mesh_slepian.slepian_functions[: mesh_slepian.N]
+        ],
+    )
+    np.testing.assert_allclose(mesh_slepian.slepian_functions_pixel, s_p, atol=1e-14)
+    assert mesh_slepian.slepian_functions_pixel is mesh_slepian.slepian_functions_pixel
+    mesh_slepian_bounded = sleplet.meshes.MeshSlepian(mesh_slepian.mesh, max_memory=1)
+    np.testing.assert_allclose(
+        mesh_slepian_bounded.slepian_functions_pixel,
+        s_p,
+        atol=1e-14,
+    )
+    assert mesh_slepian_bounded._slepian_functions_pixel is None
+
+
+def test_decompose_all_mesh_of_a_stack_matches_each_rank(
+    mesh_slepian: sleplet.meshes.mesh_slepian.MeshSlepian,
+    mesh_field_region: sleplet.meshes.mesh_field.MeshField,
+) -> None:
+    """
+    Tests that decomposing a stack of signals matches decomposing each
+    signal one rank at a time for all three methods.
+    """
+    coefficients = np.outer(np.arange(1, 4), mesh_field_region.coefficients)
+    fields = sleplet.harmonic_methods.mesh_inverse(mesh_slepian.mesh, coefficients)
+    for kwargs in ({"u_i": coefficients}, {"u": fields}, {"u": fields, "mask": True}):
+        f_p = sleplet.slepian_methods.slepian_mesh_forward(mesh_slepian, **kwargs)
+        for i, f_p_i in enumerate(f_p):
+            sd = sleplet.meshes._mesh_slepian_decomposition.MeshSlepianDecomposition(
+                mesh_slepian,
+                **{k: v[i] if k != "mask" else v for k, v in kwargs.items()},
+            )
+            np.testing.assert_allclose(
+                f_p_i,
+                [sd.decompose(rank) for rank in range(mesh_slepian.N)],
+                atol=1e-12,
+            )
@@ -67,3 +67,14 @@ def test_add_to_wavelet_name() -> None:
             sleplet._string_methods.wavelet_ending(J_MIN, arg),
             output[c],
         )
+
+
+def test_convert_memory_to_bytes() -> None:
+    """Test that human readable memory sizes are converted to bytes."""
+    arguments = [512, "100B", "2KB", "1.5 MB", "8gb"]
+    output = [512, 100, 2048, 1572864, 8589934592]
+    for c, arg in enumerate(arguments):
+        np.testing.assert_equal(
+            sleplet._string_methods.convert_memory_to_bytes(arg),
+            output[c],
+        )